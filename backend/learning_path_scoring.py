@@ -0,0 +1,112 @@
+"""
+Learning path relevance scoring
+Scores whole sets of learning path documents against a user's preferences with NumPy, so the
+recommendations and the personalized path listing share one formula
+"""
+
+from typing import Any, Dict, List
+import numpy as np
+
+def interest_values(primary_interests) -> List[str]:
+    """Plain string values of a user's primary interests (stored preferences hold strings already)"""
+    return [interest.value if hasattr(interest, 'value') else str(interest) for interest in primary_interests]
+
+_LEARNING_STYLE_TAGS = {'interactive': 'simulation', 'visual': 'visual'}
+
+def path_preference_context(user_prefs: Dict[str, Any]) -> Dict[str, Any]:
+    """Values derived from user preferences once, for scoring and explaining many paths"""
+    user_situations = user_prefs.get('user_situation', [])
+    return {
+        "interests": frozenset(interest_values(user_prefs.get('primary_interests', []))),
+        "situations": user_situations,  # kept in order for the reason text
+        "situation_set": frozenset(user_situations),
+        "preferred_difficulty": user_prefs.get('preferred_difficulty', 2),
+        "style_tag": _LEARNING_STYLE_TAGS.get(user_prefs.get('learning_style', 'balanced'))
+    }
+
+learning_path_score_arrays = (None, None)  # (catalog the arrays were built from, arrays)
+
+def get_learning_path_score_arrays(paths: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Column arrays of the path catalog used for scoring, rebuilt only when the catalog is reloaded"""
+    global learning_path_score_arrays
+    cached_paths, arrays = learning_path_score_arrays
+    if cached_paths is paths:
+        return arrays
+    
+    arrays = build_learning_path_score_arrays(paths)
+    learning_path_score_arrays = (paths, arrays)
+    return arrays
+
+def build_learning_path_score_arrays(paths: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Column arrays of learning path documents (path types stored as plain strings) used for scoring"""
+    # One boolean column per distinct tag across the catalog
+    tag_columns = {}
+    for path in paths:
+        for tag in path.get("tags", []):
+            tag_columns.setdefault(tag, len(tag_columns))
+    tag_matrix = np.zeros((len(paths), len(tag_columns)), dtype=bool)
+    for row, path in enumerate(paths):
+        tag_matrix[row, [tag_columns[tag] for tag in path.get("tags", [])]] = True
+    
+    # Path types are encoded as integer codes so interest matching is a numeric comparison
+    path_type_codes = {}
+    for path in paths:
+        path_type_codes.setdefault(path["path_type"], len(path_type_codes))
+    
+    arrays = {
+        "path_type_codes": path_type_codes,
+        "path_types": np.array([path_type_codes[path["path_type"]] for path in paths], dtype=np.intp),
+        "difficulties": np.array([path.get("difficulty_level", 1) for path in paths], dtype=np.float64),
+        "tag_columns": tag_columns,
+        "tag_matrix": tag_matrix
+    }
+    return arrays
+
+def _score_paths_kernel(
+    path_types: np.ndarray,
+    difficulties: np.ndarray,
+    tag_matrix: np.ndarray,
+    interest_codes: np.ndarray,
+    situation_columns: np.ndarray,
+    style_columns: np.ndarray,
+    preferred_difficulty: float
+) -> np.ndarray:
+    """Relevance of every path from plain arrays
+    
+    Weights: 0.4 for a path type among the user's interests, 0.3 for a tag matching one of their
+    situations, up to 0.2 for closeness to their preferred difficulty and 0.1 for their learning style
+    """
+    interest_mask = np.isin(path_types, interest_codes)
+    situation_mask = tag_matrix[:, situation_columns].any(axis=1)
+    style_mask = tag_matrix[:, style_columns].any(axis=1)
+    scores = (
+        0.4 * interest_mask
+        + 0.3 * situation_mask
+        + 0.2 * (1 - np.abs(difficulties - preferred_difficulty) / 4)
+        + 0.1 * style_mask
+    )
+    return np.clip(scores, 0.0, 1.0)
+
+def score_learning_paths(paths: List[Dict[str, Any]], context: Dict[str, Any]) -> np.ndarray:
+    """Relevance of every path in the catalog at once, from a path_preference_context"""
+    return score_path_arrays(get_learning_path_score_arrays(paths), context)
+
+def score_path_arrays(arrays: Dict[str, Any], context: Dict[str, Any]) -> np.ndarray:
+    """Relevance of every path in a set of score arrays, from a path_preference_context"""
+    path_type_codes = arrays["path_type_codes"]
+    tag_columns = arrays["tag_columns"]
+    
+    # Translate the preferences into codes and tag columns of this catalog
+    interest_codes = [path_type_codes[interest] for interest in context["interests"] if interest in path_type_codes]
+    situation_columns = [tag_columns[situation] for situation in context["situation_set"] if situation in tag_columns]
+    style_columns = [tag_columns[context["style_tag"]]] if context["style_tag"] in tag_columns else []
+    
+    return _score_paths_kernel(
+        arrays["path_types"],
+        arrays["difficulties"],
+        arrays["tag_matrix"],
+        np.array(interest_codes, dtype=np.intp),
+        np.array(situation_columns, dtype=np.intp),
+        np.array(style_columns, dtype=np.intp),
+        context["preferred_difficulty"]
+    )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -291,6 +292,11 @@ class LearningPath(BaseModel):
     created_by: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @cached_property
+    def node_index(self) -> Dict[str, LearningPathNode]:
+        """Path nodes keyed by id, built on first lookup"""
+        return {node.id: node for node in self.path_nodes}
+
 class UserLearningProgress(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
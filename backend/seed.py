@@ -0,0 +1,27 @@
+"""
+Seed the database outside the API process
+Run `python seed.py` from a deployment's init or migration step; the API does not seed on
+startup unless SEED_ON_STARTUP=true, so its startup only connects to MongoDB and creates indexes
+"""
+
+import asyncio
+import sys
+from server import client, ensure_indexes, log_listener, seed_database
+
+async def main() -> int:
+    """Create the indexes the seeders rely on, run every seed initializer once and report failures"""
+    try:
+        await ensure_indexes()
+        failed = await seed_database()
+    finally:
+        client.close()
+    if failed:
+        print(f"❌ Seeding failed for: {', '.join(failed)}")
+        return 1
+    print("✅ Database seeded")
+    return 0
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    log_listener.stop()
+    sys.exit(exit_code)
@@ -0,0 +1,168 @@
+"""
+Seed documents for the startup initializers
+Builds documents from the JSON seed data in seed_data/ (legal myths are validated, the other
+collections are trusted and only stamped with their default fields), or loads the copies baked
+ahead of time with `python seed_documents.py` (or by an earlier seeding run) so startup can
+skip building them entirely
+"""
+
+from datetime import datetime
+import hashlib
+import os
+from pathlib import Path
+import uuid
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+import orjson
+from models import LegalMyth, SimulationNode, SimulationScenario
+
+ROOT_DIR = Path(__file__).parent
+SEED_DATA_DIR = ROOT_DIR / "seed_data"
+# Point SEED_CACHE_DIR at a shared volume to let replicas reuse each other's baked documents
+SEED_CACHE_DIR = Path(os.environ.get("SEED_CACHE_DIR", ROOT_DIR / "seed_cache"))
+
+# Baked documents are split into RawBSONDocuments, which insert_many sends as-is without re-encoding
+RAW_BSON_OPTIONS = CodecOptions(document_class=RawBSONDocument)
+
+def seed_data_hash(collection: str) -> str:
+    """Content hash of a collection's seed data file, used to detect when it needs reseeding"""
+    return hashlib.blake2b((SEED_DATA_DIR / f"{collection}.json").read_bytes()).hexdigest()
+
+def read_seed_data(collection: str):
+    """Load the raw seed records for a collection from seed_data/<collection>.json"""
+    return orjson.loads((SEED_DATA_DIR / f"{collection}.json").read_bytes())
+
+def build_script_templates():
+    """Stamp the common script templates with the ScriptTemplate fields they leave to defaults
+
+    The seed file spells out every other ScriptTemplate field, so the records are trusted as-is
+    """
+    created_at = datetime.utcnow()
+    return [
+        {"id": str(uuid.uuid4()), **script_data, "created_at": created_at}
+        for script_data in read_seed_data("script_templates")
+    ]
+
+def build_legal_myths():
+    """Validate the legal myths as system-generated content"""
+    current_user_id = "system"  # System-generated myths
+    published_at = datetime.utcnow()  # the whole seed is published at once
+    return [
+        LegalMyth(**myth_data, published_at=published_at, created_by=current_user_id).model_dump()
+        for myth_data in read_seed_data("legal_myths")
+    ]
+
+def build_simulation_scenarios():
+    """Build the simulation scenarios and their nodes, yielding one document at a time
+
+    The seed file is trusted, so the models are constructed without validation; enum fields
+    keep their stored string values, which is also how they are written to MongoDB
+    """
+    for scenario_data in read_seed_data("simulation_scenarios"):
+        # Convert scenario nodes
+        scenario_nodes = [SimulationNode.model_construct(**node_data) for node_data in scenario_data["scenario_nodes"]]
+
+        # Create scenario
+        scenario = SimulationScenario.model_construct(
+            **{k: v for k, v in scenario_data.items() if k != "scenario_nodes"},
+            scenario_nodes=scenario_nodes,
+            created_by="system"
+        )
+        yield scenario.model_dump(warnings=False)
+
+def build_learning_paths():
+    """Stamp the learning paths with the LearningPath fields they leave to defaults
+
+    Path nodes are spelled out in full in the seed file (ids included), so they are embedded as-is
+    """
+    created_at = datetime.utcnow()
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            **path_data,
+            "prerequisites": [],
+            "is_active": True,
+            "created_by": "system",
+            "created_at": created_at
+        }
+        for path_data in read_seed_data("learning_paths")
+    ]
+
+def build_regional_protections():
+    """Stamp the regional protections with the RegionalProtection fields they leave to defaults
+
+    The seed file spells out every other field, with protection types as their stored values
+    """
+    created_at = datetime.utcnow()
+    return [
+        {"id": str(uuid.uuid4()), **protection_data, "created_at": created_at}
+        for protection_data in read_seed_data("regional_protections")
+    ]
+
+# Collection name -> (document builder, source files whose contents a baked copy is keyed by)
+SEED_BUILDERS = {
+    "script_templates": (build_script_templates, ("seed_data/script_templates.json", "models.py")),
+    "legal_myths": (build_legal_myths, ("seed_data/legal_myths.json", "models.py")),
+    "simulation_scenarios": (build_simulation_scenarios, ("seed_data/simulation_scenarios.json", "models.py")),
+    "learning_paths": (build_learning_paths, ("seed_data/learning_paths.json", "models.py")),
+    "regional_protections": (build_regional_protections, ("seed_data/regional_protections.json", "models.py")),
+}
+
+def baked_documents_path(collection: str) -> Path:
+    """Path of a collection's baked copy, named by a content hash of its source files
+
+    Keying on contents rather than mtimes means a checkout, image build or clock skew can never make
+    a stale copy look current; changed sources simply have no baked copy yet
+    """
+    _, sources = SEED_BUILDERS[collection]
+    source_hash = hashlib.blake2b(digest_size=16)
+    for source in sources:
+        source_hash.update((ROOT_DIR / source).read_bytes())
+    return SEED_CACHE_DIR / f"{collection}.{source_hash.hexdigest()}.bson"
+
+def write_baked_documents(collection: str, encoded_documents):
+    """Atomically write the baked copy of a collection, so concurrent readers never see a partial file"""
+    SEED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    baked_path = baked_documents_path(collection)
+    temp_path = baked_path.with_name(f"{baked_path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(b"".join(encoded_documents))
+    os.replace(temp_path, baked_path)
+    # Drop copies baked from older sources
+    for stale_path in SEED_CACHE_DIR.glob(f"{collection}.*.bson"):
+        if stale_path != baked_path:
+            stale_path.unlink(missing_ok=True)
+
+def cache_built_documents(collection: str, documents):
+    """Yield freshly built documents, baking them once all have been consumed (read-through)
+
+    Each document is encoded once and yielded as a RawBSONDocument over those bytes, so the driver
+    sends the same encoding that gets baked instead of encoding the dict a second time
+    """
+    encoded_documents = []
+    for doc in documents:
+        encoded_doc = bson.encode(doc)
+        encoded_documents.append(encoded_doc)
+        yield RawBSONDocument(encoded_doc, RAW_BSON_OPTIONS)
+    try:
+        write_baked_documents(collection, encoded_documents)
+    except OSError:
+        pass  # e.g. a read-only image; the next start simply builds again
+
+def load_seed_documents(collection: str):
+    """Return the seed documents for a collection (any iterable), preferring a copy baked from the current sources"""
+    builder, _ = SEED_BUILDERS[collection]
+    try:
+        return bson.decode_all(baked_documents_path(collection).read_bytes(), RAW_BSON_OPTIONS)
+    except FileNotFoundError:
+        return cache_built_documents(collection, builder())
+
+def bake_seed_documents():
+    """Build every seed collection once and write the documents as BSON"""
+    for collection, (builder, _) in SEED_BUILDERS.items():
+        encoded_documents = [bson.encode(doc) for doc in builder()]
+        write_baked_documents(collection, encoded_documents)
+        print(f"✅ Baked {len(encoded_documents)} {collection} documents")
+
+if __name__ == "__main__":
+    bake_seed_documents()
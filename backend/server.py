@@ -1,4 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
@@ -7,27 +8,57 @@ import os
 from mascot_system import MascotInteractionEngine, MascotAction
 from models import *
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import asyncio
+import heapq
+import queue
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Tuple
+import ahocorasick
 import bcrypt
 import jwt
 from datetime import datetime, timedelta
+from itertools import islice
 import math
 import json
+import numpy as np
 import re
 import uuid
+import weakref
 from bson import ObjectId
+from pymongo import InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from cachetools import TTLCache
 from emergentintegrations.llm.openai import LlmChat
+from learning_path_scoring import build_learning_path_score_arrays, interest_values, path_preference_context, score_learning_paths, score_path_arrays
 
 # Import our models
 from models import *
 
+# Configure logging before anything logs: records are queued and written by a listener
+# thread so that handler I/O never blocks the event loop
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, log_handler)
+logging.basicConfig(
+    level=logging.INFO,
+    handlers=[QueueHandler(log_queue)],
+    force=True  # replace any implicit handler installed by logging calls made while importing dependencies
+)
+log_listener.start()
+logger = logging.getLogger(__name__)
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL'] 
-client = AsyncIOMotorClient(mongo_url)
+MONGO_MIN_POOL_SIZE = 10
+MONGO_MAX_POOL_SIZE = 100
+client = AsyncIOMotorClient(mongo_url, minPoolSize=MONGO_MIN_POOL_SIZE, maxPoolSize=MONGO_MAX_POOL_SIZE)
 db = client[os.environ['DB_NAME']]
 
 # JWT settings
@@ -46,8 +77,27 @@ if not openai_api_key:
 else:
     openai_integration = True  # We'll create LlmChat instances as needed
 
+# CORS settings: comma-separated list of allowed frontend origins
+CORS_ORIGINS = [origin.strip() for origin in os.environ.get('CORS_ORIGINS', '*').split(',') if origin.strip()]
+CORS_MAX_AGE_SECONDS = 86400  # let browsers cache preflight responses for a day
+
+# Seeding: the database is seeded by `python seed.py`; set SEED_ON_STARTUP=true to seed on startup instead (local development)
+SEED_ON_STARTUP = os.environ.get('SEED_ON_STARTUP', 'false').lower() == 'true'
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background services before serving and stop them on shutdown (handlers are at the end of this module)"""
+    await startup_db_client()
+    yield
+    await shutdown_db_client()
+
 # Create the main app
-app = FastAPI(title="RightNow Legal Education Platform", version="1.0.0")
+app = FastAPI(
+    title="RightNow Legal Education Platform",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -55,6 +105,9 @@ api_router = APIRouter(prefix="/api")
 # Security
 security = HTTPBearer()
 
+# The mascot engine only holds static personality/message data, so one instance is shared
+MASCOT_ENGINE = MascotInteractionEngine()
+
 # Helper functions
 def clean_mongo_document(doc):
     """Convert MongoDB document to JSON-serializable format"""
@@ -105,6 +158,90 @@ async def create_notification(
         logging.error(f"Error creating notification: {str(e)}")
         return None
 
+# Writes whose result is not needed by the response (interaction logs, audit flags) are
+# queued as (collection, pymongo operation) and flushed in unordered bulk batches
+background_write_queue = asyncio.Queue()
+BACKGROUND_WRITE_BATCH_SIZE = 100
+BACKGROUND_WRITE_INTERVAL_SECONDS = 0.05
+BACKGROUND_WRITES_STOP = None  # queued on shutdown to stop the writer
+
+def queue_background_write(collection: str, operation):
+    """Queue a bulk-write operation (e.g. InsertOne) without waiting for the database"""
+    background_write_queue.put_nowait((collection, operation))
+
+async def flush_background_writes(batch: list):
+    """Apply a batch of queued operations, one unordered bulk_write per collection"""
+    operations_by_collection = {}
+    for collection, operation in batch:
+        operations_by_collection.setdefault(collection, []).append(operation)
+    
+    for collection, operations in operations_by_collection.items():
+        try:
+            await db[collection].bulk_write(operations, ordered=False)
+        except Exception:
+            logger.exception("Error flushing background writes to %s", collection)
+
+async def drain_background_writes():
+    """Batch queued writes every BACKGROUND_WRITE_INTERVAL_SECONDS or BACKGROUND_WRITE_BATCH_SIZE operations
+    
+    Returns once it reaches the stop marker queued by stop_background_writes, after writing
+    everything queued ahead of it
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await background_write_queue.get()
+        if item is BACKGROUND_WRITES_STOP:
+            return
+        batch = [item]
+        stopping = False
+        deadline = loop.time() + BACKGROUND_WRITE_INTERVAL_SECONDS
+        while len(batch) < BACKGROUND_WRITE_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(background_write_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is BACKGROUND_WRITES_STOP:
+                stopping = True
+                break
+            batch.append(item)
+        await flush_background_writes(batch)
+        if stopping:
+            return
+
+async def stop_background_writes(writer_task: asyncio.Task):
+    """Stop the writer without cancelling it mid-batch, then write anything queued after the stop marker"""
+    background_write_queue.put_nowait(BACKGROUND_WRITES_STOP)
+    await writer_task
+    await flush_pending_background_writes()
+
+async def flush_pending_background_writes():
+    """Flush whatever is still queued (used on shutdown)"""
+    batch = []
+    while not background_write_queue.empty():
+        batch.append(background_write_queue.get_nowait())
+    if batch:
+        await flush_background_writes(batch)
+
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-flight
+background_tasks = set()
+
+def spawn_background_task(coro):
+    """Run a coroutine without awaiting it (its own error handling must log failures)"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+# Set once the startup seed initializers have finished (successfully or not)
+seed_ready = asyncio.Event()
+
+async def wait_for_seed_data():
+    """Dependency for routes that read seeded collections, which are filled in the background on startup"""
+    await seed_ready.wait()
+
 def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
@@ -545,6 +682,9 @@ async def award_xp(user_id: str, xp_amount: int, action: str, context: Dict[str,
         action_url="/dashboard",
         action_data={"xp_amount": xp_amount, "action": action}
     )
+    
+    # XP, level, badges and streaks may all have changed
+    gamification_dashboard_cache.pop(user_id, None)
 
 def calculate_level_from_xp(xp: int) -> int:
     """Calculate user level based on XP (progressive formula)"""
@@ -862,9 +1002,10 @@ async def check_achievements(user_id: str, action: str, context: Dict[str, Any])
     }
     
     # Update achievements based on current action
+    user_achievement_by_id = {ua["achievement_id"]: ua for ua in user_achievements}
     for achievement_id, config in achievement_configs.items():
         if config["action"] == action or config["action"] == "any":
-            user_achievement = next((ua for ua in user_achievements if ua["achievement_id"] == achievement_id), None)
+            user_achievement = user_achievement_by_id.get(achievement_id)
             
             if not user_achievement:
                 # Create new achievement progress
@@ -1301,9 +1442,10 @@ async def get_my_questions(current_user: User = Depends(get_current_user)):
 async def create_legal_myth(myth_data: LegalMythCreate, current_user: User = Depends(get_current_user)):
     myth = LegalMyth(**myth_data.dict(), created_by=current_user.id)
     await db.legal_myths.insert_one(myth.dict())
+    invalidate_recommendation_catalog("legal_myths")
     return APIResponse(success=True, message="Legal myth created successfully", data=myth.dict())
 
-@api_router.get("/myths/daily", response_model=APIResponse)
+@api_router.get("/myths/daily", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_daily_myth(current_user: User = Depends(get_current_user)):
     """Get today's myth-busting content for the user"""
     # Get a myth the user hasn't read today
@@ -1343,7 +1485,7 @@ async def get_daily_myth(current_user: User = Depends(get_current_user)):
         data=myth_obj.dict()
     )
 
-@api_router.get("/myths/feed", response_model=APIResponse)
+@api_router.get("/myths/feed", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_myth_feed(
     page: int = 1,
     per_page: int = 10,
@@ -1405,7 +1547,7 @@ async def get_myth_feed(
         ).dict()
     )
 
-@api_router.post("/myths/{myth_id}/read", response_model=APIResponse)
+@api_router.post("/myths/{myth_id}/read", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def mark_myth_as_read(myth_id: str, current_user: User = Depends(get_current_user)):
     """Mark a myth as read and award XP"""
     myth = await db.legal_myths.find_one({"id": myth_id})
@@ -1416,7 +1558,7 @@ async def mark_myth_as_read(myth_id: str, current_user: User = Depends(get_curre
     
     return APIResponse(success=True, message="Myth marked as read", data={"xp_awarded": 15})
 
-@api_router.post("/myths/{myth_id}/like", response_model=APIResponse)
+@api_router.post("/myths/{myth_id}/like", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def like_myth(myth_id: str, current_user: User = Depends(get_current_user)):
     """Like/unlike a myth"""
     myth = await db.legal_myths.find_one({"id": myth_id})
@@ -1469,7 +1611,7 @@ async def like_myth(myth_id: str, current_user: User = Depends(get_current_user)
     
     return APIResponse(success=True, message="Myth interaction updated")
 
-@api_router.post("/myths/{myth_id}/share", response_model=APIResponse)
+@api_router.post("/myths/{myth_id}/share", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def share_myth(myth_id: str, current_user: User = Depends(get_current_user)):
     """Track myth sharing"""
     myth = await db.legal_myths.find_one({"id": myth_id})
@@ -1487,7 +1629,7 @@ async def share_myth(myth_id: str, current_user: User = Depends(get_current_user
     
     return APIResponse(success=True, message="Myth share tracked", data={"xp_awarded": 10})
 
-@api_router.get("/myths", response_model=APIResponse)
+@api_router.get("/myths", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_legal_myths(
     category: Optional[StatuteCategory] = None,
     status: Optional[LegalMythStatus] = None,
@@ -1546,7 +1688,7 @@ async def track_myth_view(user_id: str, myth_id: str):
         )
 
 # Enhanced Simulation endpoints
-@api_router.get("/simulations", response_model=APIResponse)
+@api_router.get("/simulations", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_simulations(
     category: Optional[SimulationCategory] = None,
     difficulty: Optional[int] = None,
@@ -1598,7 +1740,7 @@ async def get_simulations(
         ).dict()
     )
 
-@api_router.post("/simulations/{scenario_id}/start", response_model=APIResponse)
+@api_router.post("/simulations/{scenario_id}/start", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def start_simulation(scenario_id: str, current_user: User = Depends(get_current_user)):
     """Start a new simulation session"""
     scenario = await db.simulation_scenarios.find_one({"id": scenario_id, "is_active": True})
@@ -1632,7 +1774,7 @@ async def start_simulation(scenario_id: str, current_user: User = Depends(get_cu
         }
     )
 
-@api_router.post("/simulations/progress/{progress_id}/choice", response_model=APIResponse)
+@api_router.post("/simulations/progress/{progress_id}/choice", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def make_simulation_choice(
     progress_id: str, 
     choice_data: Dict[str, Any],
@@ -1764,7 +1906,7 @@ async def get_simulation_progress(progress_id: str, current_user: User = Depends
         data=SimulationProgress(**progress).dict()
     )
 
-@api_router.get("/simulations/user/history", response_model=APIResponse)
+@api_router.get("/simulations/user/history", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_user_simulation_history(current_user: User = Depends(get_current_user)):
     """Get user's simulation history"""
     history = await db.simulation_progress.find({
@@ -1809,7 +1951,7 @@ def get_simulation_outcome_message(score_percentage: float, scenario: Simulation
         return f"🎯 Keep learning! This {scenario.category.replace('_', ' ')} scenario is challenging. Review the legal explanations and practice more to build your confidence!"
 
 # Enhanced Learning Path endpoints with personalization
-@api_router.get("/learning-paths", response_model=APIResponse)
+@api_router.get("/learning-paths", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_learning_paths(
     path_type: Optional[LearningPathType] = None,
     difficulty: Optional[int] = None,
@@ -1838,8 +1980,12 @@ async def get_learning_paths(
     paths = await db.learning_paths.find(query).skip(skip).limit(per_page).to_list(per_page)
     
     # Enrich with user progress and personalization
+    preference_context = path_preference_context(user_prefs) if user_prefs else None
+    if preference_context and paths:
+        # Scored like recommendations, but not through the catalog's cached arrays
+        relevance_scores = score_path_arrays(build_learning_path_score_arrays(paths), preference_context)
     enriched_paths = []
-    for path in paths:
+    for index, path in enumerate(paths):
         path_obj = LearningPath(**path)
         path_dict = path_obj.dict()
         
@@ -1862,8 +2008,8 @@ async def get_learning_paths(
         
         # Add personalization score if user preferences available
         if user_prefs and personalized:
-            path_dict["relevance_score"] = calculate_path_relevance(path_obj, user_prefs)
-            path_dict["personalized_reason"] = get_personalization_reason(path_obj, user_prefs)
+            path_dict["relevance_score"] = float(relevance_scores[index])
+            path_dict["personalized_reason"] = get_personalization_reason(path_dict, preference_context)
         
         # Check prerequisites
         path_dict["prerequisites_met"] = await check_prerequisites_met(current_user.id, path_obj.prerequisites)
@@ -1886,7 +2032,7 @@ async def get_learning_paths(
         ).dict()
     )
 
-@api_router.post("/learning-paths/{path_id}/start", response_model=APIResponse)
+@api_router.post("/learning-paths/{path_id}/start", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def start_learning_path(path_id: str, current_user: User = Depends(get_current_user)):
     """Start a learning path journey"""
     path = await db.learning_paths.find_one({"id": path_id, "is_active": True})
@@ -1923,7 +2069,12 @@ async def start_learning_path(path_id: str, current_user: User = Depends(get_cur
     await db.user_learning_progress.insert_one(progress.dict())
     
     # Get the starting node with unlocked status
-    starting_node = await get_node_with_unlock_status(path_obj.start_node_id, path_obj, current_user.id)
+    start_node = path_obj.node_index.get(path_obj.start_node_id)
+    starting_node = {}
+    if start_node:
+        starting_node = start_node.dict()
+        starting_node["is_unlocked"] = _is_node_unlocked(start_node, progress.dict(), current_user.xp)
+        starting_node["is_completed"] = False
     
     return APIResponse(
         success=True,
@@ -1935,7 +2086,7 @@ async def start_learning_path(path_id: str, current_user: User = Depends(get_cur
         }
     )
 
-@api_router.get("/learning-paths/{path_id}", response_model=APIResponse)
+@api_router.get("/learning-paths/{path_id}", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_learning_path_detail(path_id: str, current_user: User = Depends(get_current_user)):
     """Get detailed learning path with user progress and unlocked nodes"""
     path = await db.learning_paths.find_one({"id": path_id, "is_active": True})
@@ -1945,7 +2096,7 @@ async def get_learning_path_detail(path_id: str, current_user: User = Depends(ge
     path_obj = LearningPath(**path)
     path_dict = path_obj.dict()
     
-    # Get user progress
+    # Get user progress; the user's XP was already loaded for this request by get_current_user
     user_progress = await db.user_learning_progress.find_one({
         "user_id": current_user.id,
         "learning_path_id": path_id
@@ -1957,14 +2108,7 @@ async def get_learning_path_detail(path_id: str, current_user: User = Depends(ge
         path_dict["user_progress"] = None
     
     # Add unlock status to each node
-    enriched_nodes = []
-    for node in path_obj.path_nodes:
-        node_dict = node.dict()
-        node_dict["is_unlocked"] = await is_node_unlocked(node, user_progress, current_user.id)
-        node_dict["is_completed"] = node.id in (user_progress.get("completed_nodes", []) if user_progress else [])
-        enriched_nodes.append(node_dict)
-    
-    path_dict["path_nodes"] = enriched_nodes
+    path_dict["path_nodes"] = nodes_with_unlock_status(path_obj, user_progress, current_user.xp)
     
     return APIResponse(
         success=True,
@@ -1972,7 +2116,7 @@ async def get_learning_path_detail(path_id: str, current_user: User = Depends(ge
         data=path_dict
     )
 
-@api_router.post("/learning-paths/{path_id}/nodes/{node_id}/complete", response_model=APIResponse)
+@api_router.post("/learning-paths/{path_id}/nodes/{node_id}/complete", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def complete_learning_node(
     path_id: str, 
     node_id: str, 
@@ -1986,7 +2130,7 @@ async def complete_learning_node(
         raise HTTPException(status_code=404, detail="Learning path not found")
     
     path_obj = LearningPath(**path)
-    node = next((n for n in path_obj.path_nodes if n.id == node_id), None)
+    node = path_obj.node_index.get(node_id)
     if not node:
         raise HTTPException(status_code=404, detail="Learning node not found")
     
@@ -2000,7 +2144,7 @@ async def complete_learning_node(
         raise HTTPException(status_code=400, detail="Learning path not started")
     
     # Check if node is unlocked
-    if not await is_node_unlocked(node, user_progress, current_user.id):
+    if not _is_node_unlocked(node, user_progress, current_user.xp):
         raise HTTPException(status_code=400, detail="Node is not yet unlocked")
     
     # Validate completion criteria if any
@@ -2044,16 +2188,12 @@ async def complete_learning_node(
         )
         
         # Get newly unlocked nodes
-        updated_progress = await db.user_learning_progress.find_one({
-            "user_id": current_user.id,
-            "learning_path_id": path_id
-        })
+        _, path_nodes = await get_all_nodes_with_unlock_status(path_obj, current_user.id)
         
-        newly_unlocked = []
-        for path_node in path_obj.path_nodes:
-            if await is_node_unlocked(path_node, updated_progress, current_user.id):
-                if path_node.id not in completed_nodes:  # Not yet completed
-                    newly_unlocked.append(path_node.dict())
+        newly_unlocked = [
+            path_node for path_node in path_nodes
+            if path_node["is_unlocked"] and not path_node["is_completed"]  # Not yet completed
+        ]
         
         return APIResponse(
             success=True,
@@ -2127,7 +2267,7 @@ async def get_user_personalization(current_user: User = Depends(get_current_user
             data=default_personalization.dict()
         )
 
-@api_router.get("/recommendations", response_model=APIResponse)
+@api_router.get("/recommendations", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_personalized_recommendations(
     content_types: Optional[str] = None,  # Comma-separated: "myths,simulations,learning_paths"
     limit: int = 10,
@@ -2138,34 +2278,37 @@ async def get_personalized_recommendations(
     user_prefs = await db.user_personalizations.find_one({"user_id": current_user.id})
     if not user_prefs:
         # Create basic recommendations for new users
-        return await get_general_recommendations(limit)
+        return await get_general_recommendations_response(limit)
     
     recommendations = []
     
     # Parse content types
     types_to_recommend = content_types.split(",") if content_types else ["learning_paths", "myths", "simulations", "qa_topics"]
     
-    for content_type in types_to_recommend:
-        if content_type == "learning_paths":
-            path_recs = await recommend_learning_paths(user_prefs, current_user.id, limit // len(types_to_recommend))
-            recommendations.extend(path_recs)
-        elif content_type == "myths":
-            myth_recs = await recommend_myths(user_prefs, current_user.id, limit // len(types_to_recommend))
-            recommendations.extend(myth_recs)
-        elif content_type == "simulations":
-            sim_recs = await recommend_simulations(user_prefs, current_user.id, limit // len(types_to_recommend))
-            recommendations.extend(sim_recs)
+    # Run the recommenders for the requested types concurrently
+    recommenders = {
+        "learning_paths": recommend_learning_paths,
+        "myths": recommend_myths,
+        "simulations": recommend_simulations
+    }
+    per_type_limit = limit // len(types_to_recommend)
+    recommendation_groups = await asyncio.gather(*(
+        recommenders[content_type](user_prefs, current_user.id, per_type_limit)
+        for content_type in types_to_recommend if content_type in recommenders
+    ))
+    for group in recommendation_groups:
+        recommendations.extend(group)
     
-    # Sort by confidence score
-    recommendations.sort(key=lambda x: x["confidence_score"], reverse=True)
+    # Keep the highest-confidence recommendations
+    top_recommendations = heapq.nlargest(limit, recommendations, key=lambda x: x["confidence_score"])
     
     return APIResponse(
         success=True,
         message="Personalized recommendations retrieved successfully",
-        data=recommendations[:limit]
+        data=top_recommendations
     )
 
-@api_router.get("/learning-paths/user/progress", response_model=APIResponse)
+@api_router.get("/learning-paths/user/progress", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_user_learning_progress(current_user: User = Depends(get_current_user)):
     """Get user's learning path progress"""
     progress_records = await db.user_learning_progress.find(
@@ -2193,292 +2336,8 @@ async def get_user_learning_progress(current_user: User = Depends(get_current_us
         data=enriched_progress
     )
 
-# Helper functions for enhanced learning paths
-def calculate_path_relevance(path: LearningPath, user_prefs: dict) -> float:
-    """Calculate relevance score for a learning path based on user preferences"""
-    score = 0.0
-    
-    # Check if path type matches user interests
-    if path.path_type.value in user_prefs.get("primary_interests", []):
-        score += 10.0
-    
-    # Check difficulty preference
-    preferred_difficulty = user_prefs.get("preferred_difficulty", 2)
-    difficulty_diff = abs(path.difficulty_level - preferred_difficulty)
-    score += max(0, 5 - difficulty_diff)
-    
-    # Check target audience match
-    user_situation = user_prefs.get("user_situation", [])
-    if any(situation in path.target_audience for situation in user_situation):
-        score += 5.0
-    
-    # Check estimated duration vs time commitment
-    weekly_commitment = user_prefs.get("weekly_time_commitment", 60)
-    if path.estimated_duration <= weekly_commitment:
-        score += 3.0
-    elif path.estimated_duration <= weekly_commitment * 2:
-        score += 1.0
-    
-    return min(score, 20.0)  # Cap at 20
-
-def get_personalization_reason(path: LearningPath, user_prefs: dict) -> str:
-    """Get explanation for why this path was recommended"""
-    reasons = []
-    
-    if path.path_type.value in user_prefs.get("primary_interests", []):
-        reasons.append(f"matches your interest in {path.path_type.value.replace('_', ' ')}")
-    
-    preferred_difficulty = user_prefs.get("preferred_difficulty", 2)
-    if abs(path.difficulty_level - preferred_difficulty) <= 1:
-        reasons.append("fits your preferred difficulty level")
-    
-    user_situation = user_prefs.get("user_situation", [])
-    matching_audience = [aud for aud in path.target_audience if aud in user_situation]
-    if matching_audience:
-        reasons.append(f"designed for {', '.join(matching_audience)}")
-    
-    if not reasons:
-        reasons.append("recommended based on your profile")
-    
-    return "Recommended because it " + " and ".join(reasons)
-
-async def check_prerequisites_met(user_id: str, prerequisites: List[str]) -> bool:
-    """Check if user has completed all prerequisite learning paths"""
-    if not prerequisites:
-        return True
-    
-    for prereq_id in prerequisites:
-        progress = await db.user_learning_progress.find_one({
-            "user_id": user_id,
-            "learning_path_id": prereq_id,
-            "is_completed": True
-        })
-        if not progress:
-            return False
-    
-    return True
-
-async def get_node_with_unlock_status(node_id: str, path: LearningPath, user_id: str) -> dict:
-    """Get a node with its unlock status"""
-    node = next((n for n in path.path_nodes if n.id == node_id), None)
-    if not node:
-        return {}
-    
-    node_dict = node.dict()
-    
-    # Get user progress to check unlock status
-    user_progress = await db.user_learning_progress.find_one({
-        "user_id": user_id,
-        "learning_path_id": path.id
-    })
-    
-    node_dict["is_unlocked"] = await is_node_unlocked(node, user_progress, user_id)
-    node_dict["is_completed"] = node.id in (user_progress.get("completed_nodes", []) if user_progress else [])
-    
-    return node_dict
-
-async def is_node_unlocked(node: LearningPathNode, user_progress: dict, user_id: str) -> bool:
-    """Check if a learning node is unlocked for the user"""
-    # First node is always unlocked if path is started
-    if not user_progress:
-        return False
-    
-    # Check if user has enough XP
-    user = await db.users.find_one({"id": user_id})
-    if user and user.get("xp", 0) < node.xp_required:
-        return False
-    
-    # Check if prerequisites are completed
-    completed_nodes = user_progress.get("completed_nodes", [])
-    for prereq_id in node.prerequisites:
-        if prereq_id not in completed_nodes:
-            return False
-    
-    return True
-
-async def validate_completion_criteria(criteria: Dict[str, Any], completion_data: Dict[str, Any], user_id: str) -> bool:
-    """Validate if completion criteria are met"""
-    # This is a flexible system for different types of completion requirements
-    
-    if criteria.get("type") == "quiz_score":
-        required_score = criteria.get("min_score", 80)
-        user_score = completion_data.get("score", 0)
-        return user_score >= required_score
-    
-    elif criteria.get("type") == "time_spent":
-        required_minutes = criteria.get("min_minutes", 5)
-        time_spent = completion_data.get("time_spent_minutes", 0)
-        return time_spent >= required_minutes
-    
-    elif criteria.get("type") == "interaction_count":
-        required_interactions = criteria.get("min_interactions", 1)
-        interactions = completion_data.get("interaction_count", 0)
-        return interactions >= required_interactions
-    
-    # Default: no specific criteria, just mark as complete
-    return True
-
-async def get_general_recommendations(limit: int) -> APIResponse:
-    """Get general recommendations for users without personalization"""
-    # Get popular learning paths
-    popular_paths = await db.learning_paths.find({
-        "is_active": True,
-        "difficulty_level": {"$lte": 2}  # Beginner-friendly
-    }).limit(limit // 2).to_list(limit // 2)
-    
-    # Get recent myths
-    recent_myths = await db.legal_myths.find({
-        "status": "published"
-    }).sort("published_at", -1).limit(limit // 4).to_list(limit // 4)
-    
-    # Get beginner simulations
-    beginner_sims = await db.simulation_scenarios.find({
-        "is_active": True,
-        "difficulty_level": 1
-    }).limit(limit // 4).to_list(limit // 4)
-    
-    recommendations = []
-    
-    # Add learning paths
-    for path in popular_paths:
-        recommendations.append({
-            "content_type": "learning_path",
-            "content_id": path["id"],
-            "title": path["title"],
-            "description": path["description"],
-            "confidence_score": 0.7,
-            "reason": "Popular beginner-friendly content"
-        })
-    
-    # Add myths
-    for myth in recent_myths:
-        recommendations.append({
-            "content_type": "myth",
-            "content_id": myth["id"],
-            "title": myth["title"],
-            "description": myth["summary"],
-            "confidence_score": 0.6,
-            "reason": "Recent myth-busting content"
-        })
-    
-    # Add simulations
-    for sim in beginner_sims:
-        recommendations.append({
-            "content_type": "simulation",
-            "content_id": sim["id"],
-            "title": sim["title"],
-            "description": sim["description"],
-            "confidence_score": 0.5,
-            "reason": "Interactive beginner scenario"
-        })
-    
-    return APIResponse(
-        success=True,
-        message="General recommendations retrieved successfully",
-        data=recommendations[:limit]
-    )
-
-async def recommend_learning_paths(user_prefs: dict, user_id: str, limit: int) -> List[Dict[str, Any]]:
-    """Recommend learning paths based on user preferences"""
-    # Get paths matching user interests
-    primary_interests = user_prefs.get("primary_interests", [])
-    query = {"is_active": True}
-    
-    if primary_interests:
-        query["path_type"] = {"$in": primary_interests}
-    
-    # Get user's completed paths to avoid recommending them
-    completed_progress = await db.user_learning_progress.find({
-        "user_id": user_id,
-        "is_completed": True
-    }).to_list(100)
-    
-    completed_path_ids = [p["learning_path_id"] for p in completed_progress]
-    if completed_path_ids:
-        query["id"] = {"$nin": completed_path_ids}
-    
-    paths = await db.learning_paths.find(query).limit(limit * 2).to_list(limit * 2)
-    
-    recommendations = []
-    for path in paths:
-        path_obj = LearningPath(**path)
-        relevance_score = calculate_path_relevance(path_obj, user_prefs)
-        
-        recommendations.append({
-            "content_type": "learning_path",
-            "content_id": path["id"],
-            "title": path["title"],
-            "description": path["description"],
-            "confidence_score": min(relevance_score / 20.0, 1.0),
-            "reason": get_personalization_reason(path_obj, user_prefs)
-        })
-    
-    # Sort by confidence and return top results
-    recommendations.sort(key=lambda x: x["confidence_score"], reverse=True)
-    return recommendations[:limit]
-
-async def recommend_myths(user_prefs: dict, user_id: str, limit: int) -> List[Dict[str, Any]]:
-    """Recommend myths based on user preferences"""
-    # Get myths user hasn't read
-    read_myths = await db.user_myth_progress.find({"user_id": user_id}).to_list(1000)
-    read_myth_ids = [m["myth_id"] for m in read_myths]
-    
-    query = {
-        "status": "published",
-        "id": {"$nin": read_myth_ids} if read_myth_ids else {}
-    }
-    
-    myths = await db.legal_myths.find(query).limit(limit).to_list(limit)
-    
-    recommendations = []
-    for myth in myths:
-        recommendations.append({
-            "content_type": "myth",
-            "content_id": myth["id"],
-            "title": myth["title"],
-            "description": myth["summary"],
-            "confidence_score": 0.7,
-            "reason": "Unread myth-busting content"
-        })
-    
-    return recommendations
-
-async def recommend_simulations(user_prefs: dict, user_id: str, limit: int) -> List[Dict[str, Any]]:
-    """Recommend simulations based on user preferences"""
-    # Get user's preferred difficulty
-    preferred_difficulty = user_prefs.get("preferred_difficulty", 2)
-    
-    # Get simulations user hasn't completed
-    completed_sims = await db.simulation_progress.find({
-        "user_id": user_id,
-        "completed": True
-    }).to_list(1000)
-    
-    completed_sim_ids = [s["scenario_id"] for s in completed_sims]
-    
-    query = {
-        "is_active": True,
-        "difficulty_level": {"$lte": preferred_difficulty + 1},
-        "id": {"$nin": completed_sim_ids} if completed_sim_ids else {}
-    }
-    
-    simulations = await db.simulation_scenarios.find(query).limit(limit).to_list(limit)
-    
-    recommendations = []
-    for sim in simulations:
-        recommendations.append({
-            "content_type": "simulation",
-            "content_id": sim["id"],
-            "title": sim["title"],
-            "description": sim["description"],
-            "confidence_score": 0.8,
-            "reason": "Interactive scenario matching your skill level"
-        })
-    
-    return recommendations
-
 # AI Chat endpoints
-@api_router.post("/ai/chat", response_model=APIResponse)
+@api_router.post("/ai/chat", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def chat_with_ai(request: ChatRequest, current_user: User = Depends(get_current_user)):
     """Main AI chat endpoint with comprehensive legal assistance"""
     if not openai_integration:
@@ -2604,7 +2463,7 @@ async def get_chat_history(session_id: str, current_user: User = Depends(get_cur
         data=[ChatMessage(**message) for message in messages]
     )
 
-@api_router.get("/ai/scripts", response_model=APIResponse)
+@api_router.get("/ai/scripts", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_script_templates(category: Optional[str] = None, state: Optional[str] = None):
     """Get available script templates"""
     query = {}
@@ -2616,11 +2475,12 @@ async def get_script_templates(category: Optional[str] = None, state: Optional[s
             {"applicable_states": {"$in": [state]}}
         ]
     
-    scripts = await db.script_templates.find(query).to_list(50)
+    # Templates are only written by the seeder from validated ScriptTemplate dumps, so they are returned as stored
+    scripts = await db.script_templates.find(query, {"_id": 0}).to_list(50)
     return APIResponse(
         success=True,
         message="Script templates retrieved successfully",
-        data=[ScriptTemplate(**script) for script in scripts]
+        data=scripts
     )
 
 # Helper functions for AI chat
@@ -2918,7 +2778,7 @@ async def create_or_update_protection_profile(
         raise HTTPException(status_code=500, detail="Failed to save protection profile")
 
 # Personalized learning content endpoints
-@api_router.get("/learning/paths", response_model=APIResponse)
+@api_router.get("/learning/paths", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_learning_paths_filtered(
     protection_type: Optional[str] = None,
     current_user: User = Depends(get_current_user)
@@ -3495,7 +3355,7 @@ async def track_user_interaction(
         logging.error(f"Error tracking interaction: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to track interaction")
 
-@api_router.get("/ai/suggestions", response_model=APIResponse)
+@api_router.get("/ai/suggestions", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_personalized_suggestions(
     current_user: User = Depends(get_current_user),
     limit: int = 10
@@ -3834,24 +3694,31 @@ async def create_emergency_alert(alert_data: EmergencyAlertCreate, current_user:
         # Send notifications (priority contacts first, then others)
         contacts_to_notify = priority_contacts + [c for c in all_contacts if c not in priority_contacts]
         
+        contacts_to_notify = contacts_to_notify[:5]  # Limit to 5 contacts to avoid spam
+        
+        # Notify all contacts concurrently so total latency is the slowest contact, not the sum
+        results = await asyncio.gather(
+            *(send_emergency_notification(alert, contact, current_user) for contact in contacts_to_notify),
+            return_exceptions=True
+        )
+        
         notification_results = []
-        for contact in contacts_to_notify[:5]:  # Limit to 5 contacts to avoid spam
-            try:
-                result = await send_emergency_notification(alert, contact, current_user)
+        for contact, result in zip(contacts_to_notify, results):
+            if isinstance(result, Exception):
+                logging.error(f"Failed to notify contact {contact['id']}: {str(result)}")
                 notification_results.append({
                     "contact_id": contact["id"],
                     "contact_name": contact["name"],
-                    "status": "sent" if result else "failed"
+                    "status": "failed",
+                    "error": str(result)
                 })
-                alert.contacts_notified.append(contact["id"])
-            except Exception as e:
-                logging.error(f"Failed to notify contact {contact['id']}: {str(e)}")
+            else:
                 notification_results.append({
                     "contact_id": contact["id"],
                     "contact_name": contact["name"],
-                    "status": "failed",
-                    "error": str(e)
+                    "status": "sent" if result else "failed"
                 })
+                alert.contacts_notified.append(contact["id"])
         
         # Update alert with notification info
         alert.notification_sent_at = datetime.utcnow()
@@ -3983,111 +3850,111 @@ async def get_emergency_guidance(alert_type: str, location: Optional[str] = None
         raise HTTPException(status_code=500, detail="Failed to retrieve emergency guidance")
 
 # Helper functions for Emergency SOS
+_EMERGENCY_RESPONSE_TEMPLATES = {
+    EmergencyAlertType.POLICE_ENCOUNTER: {
+        "legal_guidance": "You have constitutional rights during police encounters. You have the right to remain silent and the right to refuse searches without a warrant.",
+        "emergency_scripts": (
+            "I am invoking my right to remain silent.",
+            "I do not consent to any searches.",
+            "Am I free to go?",
+            "I want to speak with my attorney."
+        ),
+        "next_steps": (
+            "Remain calm and keep your hands visible",
+            "Do not resist physically, even if you believe the stop is unfair",
+            "Ask if you are free to go",
+            "Document the encounter if safe to do so",
+            "Contact a lawyer as soon as possible"
+        ),
+        "relevant_statutes": ("4th Amendment", "5th Amendment", "Miranda Rights")
+    },
+    
+    EmergencyAlertType.ICE_ENCOUNTER: {
+        "legal_guidance": "You have constitutional rights regardless of immigration status. ICE needs a judicial warrant to enter your home.",
+        "emergency_scripts": (
+            "I am exercising my right to remain silent.",
+            "I do not consent to your entry.",
+            "I want to speak with my lawyer.",
+            "If you do not have a warrant signed by a judge, I am not opening the door."
+        ),
+        "next_steps": (
+            "Ask to see a warrant signed by a judge",
+            "Do not open the door without a judicial warrant",
+            "Contact an immigration attorney immediately",
+            "Do not sign anything without legal representation",
+            "Document the encounter"
+        ),
+        "relevant_statutes": ("4th Amendment", "5th Amendment", "Immigration Law")
+    },
+    
+    EmergencyAlertType.ARREST: {
+        "legal_guidance": "If you are being arrested, you have the right to remain silent and the right to an attorney. Anything you say can be used against you.",
+        "emergency_scripts": (
+            "I am invoking my right to remain silent.",
+            "I want to speak with my attorney.",
+            "I do not consent to any searches.",
+            "I am not answering any questions without my lawyer present."
+        ),
+        "next_steps": (
+            "Do not resist arrest physically",
+            "Clearly invoke your right to remain silent",
+            "Request an attorney immediately",
+            "Do not answer questions without a lawyer",
+            "Remember details for your attorney"
+        ),
+        "relevant_statutes": ("Miranda Rights", "6th Amendment", "5th Amendment")
+    },
+    
+    EmergencyAlertType.TRAFFIC_STOP: {
+        "legal_guidance": "During traffic stops, you must provide license, registration, and insurance. You have the right to remain silent beyond that.",
+        "emergency_scripts": (
+            "Officer, I'm invoking my right to remain silent.",
+            "I do not consent to any searches.",
+            "Am I free to go?",
+            "I would like to speak with my attorney."
+        ),
+        "next_steps": (
+            "Keep your hands on the steering wheel",
+            "Provide required documents when asked",
+            "Do not exit the vehicle unless instructed",
+            "Do not consent to vehicle searches",
+            "Remain calm and polite"
+        ),
+        "relevant_statutes": ("4th Amendment", "Traffic Laws", "Search and Seizure")
+    },
+    
+    EmergencyAlertType.HOUSING_EMERGENCY: {
+        "legal_guidance": "Landlords must follow proper legal procedures for evictions. You have rights as a tenant that protect you from illegal eviction.",
+        "emergency_scripts": (
+            "I am aware of my tenant rights.",
+            "Any eviction must follow proper legal procedures.",
+            "I request all communications in writing.",
+            "I will not vacate without a court order."
+        ),
+        "next_steps": (
+            "Document all communications with landlord",
+            "Do not leave voluntarily without legal advice",
+            "Contact tenant rights organizations",
+            "Seek legal aid immediately",
+            "Take photos of any issues"
+        ),
+        "relevant_statutes": ("Tenant-Landlord Laws", "Fair Housing Act", "Eviction Procedures")
+    }
+}
+
+_DEFAULT_EMERGENCY_TEMPLATE = {
+    "legal_guidance": "You have legal rights in this situation. Stay calm and seek legal assistance.",
+    "emergency_scripts": ("I want to speak with my attorney.", "I am exercising my legal rights."),
+    "next_steps": ("Stay calm", "Document the situation", "Contact legal assistance", "Know your rights"),
+    "relevant_statutes": ("Constitutional Rights",)
+}
+
 async def generate_emergency_response(alert: EmergencyAlert, user: Optional[User]) -> Dict[str, Any]:
     """Generate comprehensive emergency response based on alert type"""
     
-    response_templates = {
-        EmergencyAlertType.POLICE_ENCOUNTER: {
-            "legal_guidance": "You have constitutional rights during police encounters. You have the right to remain silent and the right to refuse searches without a warrant.",
-            "emergency_scripts": [
-                "I am invoking my right to remain silent.",
-                "I do not consent to any searches.",
-                "Am I free to go?",
-                "I want to speak with my attorney."
-            ],
-            "next_steps": [
-                "Remain calm and keep your hands visible",
-                "Do not resist physically, even if you believe the stop is unfair",
-                "Ask if you are free to go",
-                "Document the encounter if safe to do so",
-                "Contact a lawyer as soon as possible"
-            ],
-            "relevant_statutes": ["4th Amendment", "5th Amendment", "Miranda Rights"]
-        },
-        
-        EmergencyAlertType.ICE_ENCOUNTER: {
-            "legal_guidance": "You have constitutional rights regardless of immigration status. ICE needs a judicial warrant to enter your home.",
-            "emergency_scripts": [
-                "I am exercising my right to remain silent.",
-                "I do not consent to your entry.",
-                "I want to speak with my lawyer.",
-                "If you do not have a warrant signed by a judge, I am not opening the door."
-            ],
-            "next_steps": [
-                "Ask to see a warrant signed by a judge",
-                "Do not open the door without a judicial warrant",
-                "Contact an immigration attorney immediately",
-                "Do not sign anything without legal representation",
-                "Document the encounter"
-            ],
-            "relevant_statutes": ["4th Amendment", "5th Amendment", "Immigration Law"]
-        },
-        
-        EmergencyAlertType.ARREST: {
-            "legal_guidance": "If you are being arrested, you have the right to remain silent and the right to an attorney. Anything you say can be used against you.",
-            "emergency_scripts": [
-                "I am invoking my right to remain silent.",
-                "I want to speak with my attorney.",
-                "I do not consent to any searches.",
-                "I am not answering any questions without my lawyer present."
-            ],
-            "next_steps": [
-                "Do not resist arrest physically",
-                "Clearly invoke your right to remain silent",
-                "Request an attorney immediately",
-                "Do not answer questions without a lawyer",
-                "Remember details for your attorney"
-            ],
-            "relevant_statutes": ["Miranda Rights", "6th Amendment", "5th Amendment"]
-        },
-        
-        EmergencyAlertType.TRAFFIC_STOP: {
-            "legal_guidance": "During traffic stops, you must provide license, registration, and insurance. You have the right to remain silent beyond that.",
-            "emergency_scripts": [
-                "Officer, I'm invoking my right to remain silent.",
-                "I do not consent to any searches.",
-                "Am I free to go?",
-                "I would like to speak with my attorney."
-            ],
-            "next_steps": [
-                "Keep your hands on the steering wheel",
-                "Provide required documents when asked",
-                "Do not exit the vehicle unless instructed",
-                "Do not consent to vehicle searches",
-                "Remain calm and polite"
-            ],
-            "relevant_statutes": ["4th Amendment", "Traffic Laws", "Search and Seizure"]
-        },
-        
-        EmergencyAlertType.HOUSING_EMERGENCY: {
-            "legal_guidance": "Landlords must follow proper legal procedures for evictions. You have rights as a tenant that protect you from illegal eviction.",
-            "emergency_scripts": [
-                "I am aware of my tenant rights.",
-                "Any eviction must follow proper legal procedures.",
-                "I request all communications in writing.",
-                "I will not vacate without a court order."
-            ],
-            "next_steps": [
-                "Document all communications with landlord",
-                "Do not leave voluntarily without legal advice",
-                "Contact tenant rights organizations",
-                "Seek legal aid immediately",
-                "Take photos of any issues"
-            ],
-            "relevant_statutes": ["Tenant-Landlord Laws", "Fair Housing Act", "Eviction Procedures"]
-        }
-    }
-    
-    # Get response template or create default
-    template = response_templates.get(
-        alert.alert_type,
-        {
-            "legal_guidance": "You have legal rights in this situation. Stay calm and seek legal assistance.",
-            "emergency_scripts": ["I want to speak with my attorney.", "I am exercising my legal rights."],
-            "next_steps": ["Stay calm", "Document the situation", "Contact legal assistance", "Know your rights"],
-            "relevant_statutes": ["Constitutional Rights"]
-        }
-    )
+    # Copy the shared template so per-alert edits never leak into the constant
+    template = _EMERGENCY_RESPONSE_TEMPLATES.get(alert.alert_type, _DEFAULT_EMERGENCY_TEMPLATE)
+    template = {key: list(value) if isinstance(value, tuple) else value for key, value in template.items()}
     
     # Add location-specific information if available
     if alert.location:
@@ -4131,7 +3998,7 @@ This alert was sent automatically by the RightNow Legal Education Platform.
 """
         
         # Log the notification (in production, send via SMS/email service)
-        logging.info(f"Emergency notification sent to {contact['name']} ({contact['phone_number']}): {message}")
+        logging.info("Emergency notification sent to %s (%s): %s", contact['name'], contact['phone_number'], message)
         
         # In production, integrate with:
         # - Twilio for SMS: await send_sms(contact['phone_number'], message)
@@ -4144,12 +4011,39 @@ This alert was sent automatically by the RightNow Legal Education Platform.
         return False
 
 # Full Gamification System Integration endpoints
+# Per-user dashboard responses; award_xp evicts a user's entry when their XP changes
+gamification_dashboard_cache = TTLCache(maxsize=10_000, ttl=30)
+# Per-user build locks, so concurrent misses for one user share a single build; unused locks drop out
+gamification_dashboard_locks = weakref.WeakValueDictionary()
+
 @api_router.get("/gamification/dashboard", response_model=APIResponse)
 async def get_gamification_dashboard(current_user: User = Depends(get_current_user)):
     """Get comprehensive gamification dashboard data"""
+    cached_response = gamification_dashboard_cache.get(current_user.id)
+    if cached_response is not None:
+        return cached_response
+    
+    lock = gamification_dashboard_locks.get(current_user.id)
+    if lock is None:
+        lock = gamification_dashboard_locks[current_user.id] = asyncio.Lock()
+    async with lock:
+        # Another request may have built the dashboard while this one waited
+        cached_response = gamification_dashboard_cache.get(current_user.id)
+        if cached_response is not None:
+            return cached_response
+        return await build_gamification_dashboard(current_user)
+
+async def build_gamification_dashboard(current_user: User) -> APIResponse:
+    """Build the gamification dashboard, caching it only when every section was actually loaded"""
+    now = datetime.utcnow()
+    used_fallback = False
     try:
         # Get user stats - use fallback if not found
-        user_stats = await db.user_stats.find_one({"user_id": current_user.id})
+        user_stats = await db.user_stats.find_one(
+            {"user_id": current_user.id},
+            {"_id": 0, "total_xp": 1, "level": 1, "badges_earned": 1, "achievements_completed": 1,
+             "streak_days": 1, "justice_meter_score": 1}
+        )
         if not user_stats:
             # Create initial stats from current user data
             user_stats = {
@@ -4168,30 +4062,34 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
                 "ai_chats_initiated": 0,
                 "streak_days": current_user.streak_days,
                 "justice_meter_score": 75,
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
+                "created_at": now,
+                "updated_at": now
             }
             await db.user_stats.insert_one(user_stats)
         
         # Get user badges with fallback
         user_badges = []
         try:
-            user_badges_cursor = db.user_badges.find({"user_id": current_user.id})
+            user_badges_cursor = db.user_badges.find({"user_id": current_user.id}, {"_id": 0, "badge_id": 1})
             user_badges_list = await user_badges_cursor.to_list(100)
             badge_details = []
             for user_badge in user_badges_list:
-                badge = await db.badges.find_one({"id": user_badge["badge_id"]})
+                badge = await db.badges.find_one(
+                    {"id": user_badge["badge_id"]},
+                    {"_id": 0, "id": 1, "name": 1, "description": 1, "rarity": 1, "earned_at": 1}
+                )
                 if badge:
                     badge_details.append({
                         "id": badge.get("id"),
                         "name": badge.get("name", "Unknown Badge"),
                         "description": badge.get("description", ""),
                         "rarity": badge.get("rarity", "common"),
-                        "earned_at": badge.get("earned_at", datetime.utcnow()).isoformat() if badge.get("earned_at") else datetime.utcnow().isoformat()
+                        "earned_at": badge.get("earned_at", now).isoformat() if badge.get("earned_at") else now.isoformat()
                     })
             user_badges = badge_details
         except Exception as e:
             logging.warning(f"Error fetching user badges: {str(e)}")
+            used_fallback = True
             # Fallback badges
             user_badges = [
                 {
@@ -4199,14 +4097,14 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
                     "name": "First Steps",
                     "description": "Started your legal journey",
                     "rarity": "common",
-                    "earned_at": datetime.utcnow().isoformat()
+                    "earned_at": now.isoformat()
                 },
                 {
                     "id": "2",
                     "name": "Knowledge Seeker",
                     "description": "Completed 5 lessons",
                     "rarity": "uncommon",
-                    "earned_at": datetime.utcnow().isoformat()
+                    "earned_at": now.isoformat()
                 }
             ]
         
@@ -4218,6 +4116,7 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
             user_achievements = [clean_mongo_document(achievement) for achievement in user_achievements_raw]
         except Exception as e:
             logging.warning(f"Error fetching user achievements: {str(e)}")
+            used_fallback = True
             # Fallback achievements
             user_achievements = [
                 {
@@ -4244,6 +4143,7 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
             streaks = [clean_mongo_document(streak) for streak in streaks_raw]
         except Exception as e:
             logging.warning(f"Error fetching streaks: {str(e)}")
+            used_fallback = True
             # Fallback streak
             streaks = [
                 {
@@ -4251,18 +4151,32 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
                     "streak_type": "daily_learning",
                     "current_streak": current_user.streak_days,
                     "longest_streak": current_user.streak_days,
-                    "last_activity": datetime.utcnow().isoformat()
+                    "last_activity": now.isoformat()
                 }
             ]
         
-        # Get recent XP transactions with fallback
+        # Get recent XP transactions and today's XP total in one round trip, with fallback
         recent_xp = []
+        today_xp = 0
         try:
-            recent_xp_cursor = db.xp_transactions.find({"user_id": current_user.id}).sort("created_at", -1).limit(10)
-            recent_xp_raw = await recent_xp_cursor.to_list(10)
-            recent_xp = [clean_mongo_document(xp) for xp in recent_xp_raw]
+            start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            xp_pipeline = [
+                {"$match": {"user_id": current_user.id}},
+                {"$sort": {"created_at": -1}},
+                {"$facet": {
+                    "recent": [{"$limit": 10}],
+                    "today": [
+                        {"$match": {"created_at": {"$gte": start_of_day}}},
+                        {"$group": {"_id": None, "xp": {"$sum": "$xp_amount"}}}
+                    ]
+                }}
+            ]
+            xp_facets = (await db.xp_transactions.aggregate(xp_pipeline).to_list(1))[0]
+            recent_xp = [clean_mongo_document(xp) for xp in xp_facets["recent"]]
+            today_xp = xp_facets["today"][0]["xp"] if xp_facets["today"] else 0
         except Exception as e:
             logging.warning(f"Error fetching recent XP: {str(e)}")
+            used_fallback = True
             # Fallback XP transactions
             recent_xp = [
                 {
@@ -4270,7 +4184,7 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
                     "xp_amount": 10,
                     "source": "ai_chat",
                     "description": "AI Chat Interaction",
-                    "created_at": datetime.utcnow().isoformat()
+                    "created_at": now.isoformat()
                 }
             ]
         
@@ -4293,6 +4207,7 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
                     }
         except Exception as e:
             logging.warning(f"Error fetching leaderboard: {str(e)}")
+            used_fallback = True
             # Fallback rank
             user_rank = {
                 "rank": 1,
@@ -4316,7 +4231,7 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
             "progress_percentage": min(100, ((current_xp - current_level_xp) / (next_level_xp - current_level_xp)) * 100) if next_level <= 50 and (next_level_xp - current_level_xp) > 0 else 100
         }
         
-        return APIResponse(
+        response = APIResponse(
             success=True,
             message="Gamification dashboard retrieved successfully",
             data={
@@ -4333,9 +4248,13 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
                 "achievements": user_achievements,
                 "streaks": streaks,
                 "recent_xp": recent_xp,
+                "today_xp": today_xp,
                 "leaderboard_position": user_rank
             }
         )
+        if not used_fallback:
+            gamification_dashboard_cache[current_user.id] = response
+        return response
         
     except Exception as e:
         logging.error(f"Error getting gamification dashboard: {str(e)}")
@@ -4366,7 +4285,7 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
                         "name": "First Steps",
                         "description": "Started your legal journey",
                         "rarity": "common",
-                        "earned_at": datetime.utcnow()
+                        "earned_at": now
                     }
                 ],
                 "achievements": [
@@ -4384,7 +4303,7 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
                         "streak_type": "daily_learning",
                         "current_streak": current_user.streak_days,
                         "longest_streak": current_user.streak_days,
-                        "last_activity": datetime.utcnow()
+                        "last_activity": now
                     }
                 ],
                 "recent_xp": [
@@ -4393,9 +4312,10 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
                         "xp_amount": 10,
                         "source": "ai_chat",
                         "description": "AI Chat Interaction",
-                        "created_at": datetime.utcnow()
+                        "created_at": now
                     }
                 ],
+                "today_xp": 0,
                 "leaderboard_position": {
                     "rank": 1,
                     "score": current_user.xp,
@@ -4404,23 +4324,14 @@ async def get_gamification_dashboard(current_user: User = Depends(get_current_us
             }
         )
 
+# XP required per level, indexed by level. Levels 7+ follow 1000 + (level - 6) * 150
+_XP_TABLE = (0, 0, 100, 250, 450, 700, 1000) + tuple(1000 + (level - 6) * 150 for level in range(7, 201))
+
 def calculate_xp_for_level(level: int) -> int:
     """Calculate XP required for a specific level"""
-    if level <= 1:
-        return 0
-    elif level == 2:
-        return 100
-    elif level == 3:
-        return 250
-    elif level == 4:
-        return 450
-    elif level == 5:
-        return 700
-    elif level == 6:
-        return 1000
-    else:
-        # For levels 7+: 1000 + (level - 6) * 150
-        return 1000 + (level - 6) * 150
+    if level < len(_XP_TABLE):
+        return _XP_TABLE[max(level, 0)]
+    return 1000 + (level - 6) * 150
 
 @api_router.get("/gamification/leaderboard", response_model=APIResponse)
 async def get_leaderboard(
@@ -4430,24 +4341,56 @@ async def get_leaderboard(
 ):
     """Get leaderboard data"""
     try:
-        leaderboard = await db.leaderboards.find_one({
-            "leaderboard_type": leaderboard_type,
-            "is_active": True
-        })
+        # Only the top N entries and the caller's own entry leave the server
+        pipeline = [
+            {"$match": {"leaderboard_type": leaderboard_type, "is_active": True}},
+            {"$limit": 1},
+            {"$project": {
+                "_id": 0,
+                "period_start": 1,
+                "period_end": 1,
+                "top": {"$slice": ["$user_rankings", limit]},
+                "me": {"$arrayElemAt": [
+                    {"$filter": {
+                        "input": "$user_rankings",
+                        "as": "r",
+                        "cond": {"$eq": ["$$r.user_id", current_user.id]}
+                    }},
+                    0
+                ]},
+                "total": {"$size": "$user_rankings"}
+            }},
+            # A plain equality $lookup (indexed on users.id on every MongoDB version), trimmed to the
+            # public fields in the next stage; combining localField with a pipeline needs MongoDB 5.0
+            {"$lookup": {
+                "from": "users",
+                "localField": "top.user_id",
+                "foreignField": "id",
+                "as": "top_users"
+            }},
+            {"$addFields": {"top_users": {"$map": {
+                "input": "$top_users",
+                "as": "u",
+                "in": {"id": "$$u.id", "username": "$$u.username", "level": "$$u.level", "badges": "$$u.badges"}
+            }}}}
+        ]
+        leaderboards = await db.leaderboards.aggregate(pipeline).to_list(1)
         
-        if not leaderboard:
+        if not leaderboards:
             return APIResponse(
                 success=True,
                 message="No active leaderboard found",
                 data={"rankings": [], "user_rank": None}
             )
+        leaderboard = leaderboards[0]
         
-        # Get user details for rankings
-        user_rankings = leaderboard.get("user_rankings", [])[:limit]
-        enriched_rankings = []
+        # User details for the top rankings were joined in by the $lookup stage
+        user_rankings = leaderboard.get("top", [])
+        users_by_id = {user["id"]: user for user in leaderboard.get("top_users", [])}
         
+        enriched_rankings = []
         for entry in user_rankings:
-            user = await db.users.find_one({"id": entry["user_id"]})
+            user = users_by_id.get(entry["user_id"])
             if user:
                 enriched_rankings.append({
                     "rank": entry["rank"],
@@ -4460,14 +4403,14 @@ async def get_leaderboard(
                     }
                 })
         
-        # Find current user's position
-        user_entry = next((entry for entry in user_rankings if entry["user_id"] == current_user.id), None)
+        # Current user's position across the whole leaderboard
+        user_entry = leaderboard.get("me")
         user_rank = None
         if user_entry:
             user_rank = {
                 "rank": user_entry["rank"],
                 "score": user_entry["score"],
-                "total_players": len(user_rankings)
+                "total_players": leaderboard["total"]
             }
         
         return APIResponse(
@@ -4499,23 +4442,25 @@ async def get_available_badges(
         if category:
             query["category"] = category
         
-        all_badges = await db.badges.find(query).to_list(100)
+        all_badges = await db.badges.find(query, {"_id": 0}).to_list(100)
         
         # Get user's earned badges
-        user_badges = await db.user_badges.find({"user_id": current_user.id}).to_list(100)
-        earned_badge_ids = [ub["badge_id"] for ub in user_badges]
+        user_badges = await db.user_badges.find(
+            {"user_id": current_user.id},
+            {"_id": 0, "badge_id": 1, "earned_at": 1}
+        ).to_list(100)
+        user_badge_by_id = {ub["badge_id"]: ub for ub in user_badges}
         
         # Enrich badges with earned status
         enriched_badges = []
         for badge in all_badges:
-            badge_dict = Badge(**badge).dict()
-            is_earned = badge["id"] in earned_badge_ids
+            badge_dict = badge  # stored from Badge.dict(), so already in response shape
+            user_badge = user_badge_by_id.get(badge["id"])
+            is_earned = user_badge is not None
             badge_dict["is_earned"] = is_earned
             
             if is_earned:
-                user_badge = next((ub for ub in user_badges if ub["badge_id"] == badge["id"]), None)
-                if user_badge:
-                    badge_dict["earned_at"] = user_badge["earned_at"]
+                badge_dict["earned_at"] = user_badge["earned_at"]
             
             if not earned_only or is_earned:
                 enriched_badges.append(badge_dict)
@@ -4528,7 +4473,7 @@ async def get_available_badges(
             message="Badges retrieved successfully",
             data={
                 "badges": enriched_badges,
-                "earned_count": len(earned_badge_ids),
+                "earned_count": len(user_badges),
                 "total_count": len(all_badges)
             }
         )
@@ -4537,87 +4482,72 @@ async def get_available_badges(
         logging.error(f"Error getting badges: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve badges")
 
+# Read-only achievement catalogue shown on the achievements page
+_ACHIEVEMENT_TEMPLATES = MappingProxyType({
+    "read_100_statutes": {
+        "name": "Century Reader",
+        "description": "Read 100 legal statutes",
+        "icon": "📚",
+        "target": 100,
+        "xp_reward": 100
+    },
+    "ask_50_questions": {
+        "name": "Inquisitive Mind",
+        "description": "Ask 50 questions in the community",
+        "icon": "❓",
+        "target": 50,
+        "xp_reward": 75
+    },
+    "complete_10_simulations": {
+        "name": "Simulation Master",
+        "description": "Complete 10 legal simulations",
+        "icon": "🎭",
+        "target": 10,
+        "xp_reward": 150
+    },
+    "earn_1000_xp": {
+        "name": "XP Collector",
+        "description": "Earn 1000 total XP",
+        "icon": "⭐",
+        "target": 1000,
+        "xp_reward": 100
+    },
+    "daily_streak_30": {
+        "name": "Dedicated Learner",
+        "description": "Maintain a 30-day learning streak",
+        "icon": "🔥",
+        "target": 30,
+        "xp_reward": 200
+    }
+})
+
 @api_router.get("/gamification/achievements", response_model=APIResponse)
 async def get_achievements(current_user: User = Depends(get_current_user)):
     """Get user's achievements and progress"""
     try:
-        user_achievements = await db.user_achievements.find({"user_id": current_user.id}).to_list(100)
-        
-        # Define achievement templates
-        achievement_templates = {
-            "read_100_statutes": {
-                "name": "Century Reader",
-                "description": "Read 100 legal statutes",
-                "icon": "📚",
-                "target": 100,
-                "xp_reward": 100
-            },
-            "ask_50_questions": {
-                "name": "Inquisitive Mind",
-                "description": "Ask 50 questions in the community",
-                "icon": "❓",
-                "target": 50,
-                "xp_reward": 75
-            },
-            "complete_10_simulations": {
-                "name": "Simulation Master",
-                "description": "Complete 10 legal simulations",
-                "icon": "🎭",
-                "target": 10,
-                "xp_reward": 150
-            },
-            "earn_1000_xp": {
-                "name": "XP Collector",
-                "description": "Earn 1000 total XP",
-                "icon": "⭐",
-                "target": 1000,
-                "xp_reward": 100
-            },
-            "daily_streak_30": {
-                "name": "Dedicated Learner",
-                "description": "Maintain a 30-day learning streak",
-                "icon": "🔥",
-                "target": 30,
-                "xp_reward": 200
-            }
-        }
+        user_achievements = await db.user_achievements.find(
+            {"user_id": current_user.id},
+            {"_id": 0, "achievement_id": 1, "current_progress": 1, "is_completed": 1, "completed_at": 1}
+        ).to_list(100)
         
-        # Enrich achievements with template data
+        # Enrich every template in one pass, overlaying the user's progress where it exists
+        achievements_by_id = {a["achievement_id"]: a for a in user_achievements}
         enriched_achievements = []
-        for achievement in user_achievements:
-            template = achievement_templates.get(achievement["achievement_id"])
-            if template:
-                achievement_dict = {
-                    "id": achievement["achievement_id"],
-                    "name": template["name"],
-                    "description": template["description"],
-                    "icon": template["icon"],
-                    "target": template["target"],
-                    "current_progress": achievement.get("current_progress", 0),
-                    "is_completed": achievement.get("is_completed", False),
-                    "completed_at": achievement.get("completed_at"),
-                    "xp_reward": template["xp_reward"],
-                    "progress_percentage": min(100, (achievement.get("current_progress", 0) / template["target"]) * 100)
-                }
-                enriched_achievements.append(achievement_dict)
-        
-        # Add missing achievements (not started yet)
-        existing_ids = [a["achievement_id"] for a in user_achievements]
-        for achievement_id, template in achievement_templates.items():
-            if achievement_id not in existing_ids:
-                achievement_dict = {
-                    "id": achievement_id,
-                    "name": template["name"],
-                    "description": template["description"],
-                    "icon": template["icon"],
-                    "target": template["target"],
-                    "current_progress": 0,
-                    "is_completed": False,
-                    "completed_at": None,
-                    "xp_reward": template["xp_reward"],
-                    "progress_percentage": 0
-                }
-                enriched_achievements.append(achievement_dict)
+        for achievement_id, template in _ACHIEVEMENT_TEMPLATES.items():
+            achievement = achievements_by_id.get(achievement_id, {})
+            current_progress = achievement.get("current_progress", 0)
+            enriched_achievements.append({
+                "id": achievement_id,
+                "name": template["name"],
+                "description": template["description"],
+                "icon": template["icon"],
+                "target": template["target"],
+                "current_progress": current_progress,
+                "is_completed": achievement.get("is_completed", False),
+                "completed_at": achievement.get("completed_at"),
+                "xp_reward": template["xp_reward"],
+                "progress_percentage": min(100, (current_progress / template["target"]) * 100)
+            })
         
         # Sort by completion status and progress
         enriched_achievements.sort(key=lambda x: (x["is_completed"], -x["progress_percentage"]))
@@ -4636,33 +4566,29 @@ async def get_achievements(current_user: User = Depends(get_current_user)):
         logging.error(f"Error getting achievements: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve achievements")
 
+# streak_type -> (display name, description, icon, days before the streak lapses)
+_STREAK_META = {
+    "daily_login": ("Daily Login", "Consecutive days of logging in", "📅", 1),
+    "weekly_learning": ("Weekly Learning", "Consecutive weeks of learning activity", "📚", 7),
+}
+
 @api_router.get("/gamification/streaks", response_model=APIResponse)
 async def get_user_streaks(current_user: User = Depends(get_current_user)):
     """Get user's streak information"""
     try:
-        streaks = await db.streaks.find({"user_id": current_user.id}).to_list(10)
+        streaks = await db.streaks.find({"user_id": current_user.id}, {"_id": 0}).to_list(10)
         
         # Enrich streaks with user-friendly data
+        now = datetime.utcnow()
         enriched_streaks = []
         for streak in streaks:
-            streak_dict = Streak(**streak).dict()
-            
-            # Add user-friendly information
-            if streak["streak_type"] == "daily_login":
-                streak_dict["display_name"] = "Daily Login"
-                streak_dict["description"] = "Consecutive days of logging in"
-                streak_dict["icon"] = "📅"
-            elif streak["streak_type"] == "weekly_learning":
-                streak_dict["display_name"] = "Weekly Learning"
-                streak_dict["description"] = "Consecutive weeks of learning activity"
-                streak_dict["icon"] = "📚"
+            streak_dict = streak
             
-            # Check if streak is still active (within last 24 hours for daily, 7 days for weekly)
-            now = datetime.utcnow()
-            if streak["streak_type"] == "daily_login":
-                streak_dict["is_active"] = (now - streak["last_activity"]).days <= 1
-            elif streak["streak_type"] == "weekly_learning":
-                streak_dict["is_active"] = (now - streak["last_activity"]).days <= 7
+            # Add user-friendly information and check the streak is still within its window
+            meta = _STREAK_META.get(streak["streak_type"])
+            if meta:
+                streak_dict["display_name"], streak_dict["description"], streak_dict["icon"], window_days = meta
+                streak_dict["is_active"] = (now - streak["last_activity"]).days <= window_days
             
             enriched_streaks.append(streak_dict)
         
@@ -4676,6 +4602,17 @@ async def get_user_streaks(current_user: User = Depends(get_current_user)):
         logging.error(f"Error getting streaks: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve streaks")
 
+async def get_daily_xp_totals(query: Dict[str, Any]) -> Dict[str, int]:
+    """Sum XP per day (YYYY-MM-DD) for transactions matching query, streaming the grouped rows"""
+    pipeline = [
+        {"$match": query},
+        {"$group": {
+            "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+            "xp": {"$sum": "$xp_amount"}
+        }}
+    ]
+    return {day["_id"]: day["xp"] async for day in db.xp_transactions.aggregate(pipeline)}
+
 @api_router.get("/gamification/xp-history", response_model=APIResponse)
 async def get_xp_history(
     days: int = 30,
@@ -4684,37 +4621,29 @@ async def get_xp_history(
     """Get user's XP earning history"""
     try:
         # Get XP transactions from last N days
-        start_date = datetime.utcnow() - timedelta(days=days)
-        xp_transactions = await db.xp_transactions.find({
+        now = datetime.utcnow()
+        start_date = now - timedelta(days=days)
+        period_query = {
             "user_id": current_user.id,
             "created_at": {"$gte": start_date}
-        }).sort("created_at", -1).to_list(1000)
-        
-        # Group by day for chart data
-        daily_xp = {}
-        for transaction in xp_transactions:
-            day = transaction["created_at"].date().isoformat()
-            if day not in daily_xp:
-                daily_xp[day] = 0
-            daily_xp[day] += transaction["xp_amount"]
-        
-        # Create chart data
-        chart_data = []
-        for i in range(days):
-            date = (datetime.utcnow() - timedelta(days=i)).date()
-            date_str = date.isoformat()
-            chart_data.append({
-                "date": date_str,
-                "xp": daily_xp.get(date_str, 0)
-            })
+        }
+        
+        # Group by day on the server; only the recent transactions are shipped back
+        daily_xp, xp_transactions = await asyncio.gather(
+            get_daily_xp_totals(period_query),
+            db.xp_transactions.find(period_query, {"_id": 0}).sort("created_at", -1).limit(50).to_list(50)
+        )
         
-        chart_data.reverse()  # Oldest first
+        # Create chart data, oldest first
+        today = now.date()
+        chart_dates = [(today - timedelta(days=i)).isoformat() for i in range(days - 1, -1, -1)]
+        chart_data = [{"date": date_str, "xp": daily_xp.get(date_str, 0)} for date_str in chart_dates]
         
         return APIResponse(
             success=True,
             message="XP history retrieved successfully",
             data={
-                "recent_transactions": [XPTransaction(**t).dict() for t in xp_transactions[:50]],
+                "recent_transactions": xp_transactions,
                 "daily_chart": chart_data,
                 "total_xp_period": sum(daily_xp.values()),
                 "average_daily_xp": sum(daily_xp.values()) / max(len(daily_xp), 1)
@@ -4725,58 +4654,67 @@ async def get_xp_history(
         logging.error(f"Error getting XP history: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve XP history")
 
-@api_router.get("/gamification/progress", response_model=APIResponse)
+@api_router.get("/gamification/progress", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_user_progress(current_user: User = Depends(get_current_user)):
     """Get comprehensive user progress across all features"""
     try:
         # Get detailed progress from all features
         progress_data = {}
         
-        # Statute reading progress
-        statutes_read = await db.user_statute_progress.count_documents({"user_id": current_user.id})
-        total_statutes = await db.legal_statutes.count_documents({})
+        (
+            statutes_read, total_statutes,
+            myths_read, total_myths,
+            simulations_completed, total_simulations,
+            learning_paths_completed, total_learning_paths,
+            questions_asked, answers_provided,
+            ai_conversations
+        ) = await asyncio.gather(
+            db.user_statute_progress.count_documents({"user_id": current_user.id}),
+            db.legal_statutes.estimated_document_count(),
+            db.user_myth_progress.count_documents({"user_id": current_user.id}),
+            db.legal_myths.count_documents({"status": "published"}),
+            db.simulation_progress.count_documents({"user_id": current_user.id, "completed": True}),
+            db.simulation_scenarios.count_documents({"is_active": True}),
+            db.user_learning_progress.count_documents({"user_id": current_user.id, "is_completed": True}),
+            db.learning_paths.count_documents({"is_active": True}),
+            db.questions.count_documents({"author_id": current_user.id}),
+            db.answers.count_documents({"author_id": current_user.id}),
+            db.chat_sessions.count_documents({"user_id": current_user.id})
+        )
+        
+        # Statute reading progress
+        statutes_percentage = (statutes_read / max(total_statutes, 1)) * 100
         progress_data["statutes"] = {
             "read": statutes_read,
             "total": total_statutes,
-            "percentage": (statutes_read / max(total_statutes, 1)) * 100
+            "percentage": statutes_percentage
         }
         
         # Myth reading progress
-        myths_read = await db.user_myth_progress.count_documents({"user_id": current_user.id})
-        total_myths = await db.legal_myths.count_documents({"status": "published"})
+        myths_percentage = (myths_read / max(total_myths, 1)) * 100
         progress_data["myths"] = {
             "read": myths_read,
             "total": total_myths,
-            "percentage": (myths_read / max(total_myths, 1)) * 100
+            "percentage": myths_percentage
         }
         
         # Simulation progress
-        simulations_completed = await db.simulation_progress.count_documents({
-            "user_id": current_user.id,
-            "completed": True
-        })
-        total_simulations = await db.simulation_scenarios.count_documents({"is_active": True})
+        simulations_percentage = (simulations_completed / max(total_simulations, 1)) * 100
         progress_data["simulations"] = {
             "completed": simulations_completed,
             "total": total_simulations,
-            "percentage": (simulations_completed / max(total_simulations, 1)) * 100
+            "percentage": simulations_percentage
         }
         
         # Learning path progress
-        learning_paths_completed = await db.user_learning_progress.count_documents({
-            "user_id": current_user.id,
-            "is_completed": True
-        })
-        total_learning_paths = await db.learning_paths.count_documents({"is_active": True})
+        learning_paths_percentage = (learning_paths_completed / max(total_learning_paths, 1)) * 100
         progress_data["learning_paths"] = {
             "completed": learning_paths_completed,
             "total": total_learning_paths,
-            "percentage": (learning_paths_completed / max(total_learning_paths, 1)) * 100
+            "percentage": learning_paths_percentage
         }
         
         # Community engagement
-        questions_asked = await db.questions.count_documents({"author_id": current_user.id})
-        answers_provided = await db.answers.count_documents({"author_id": current_user.id})
         progress_data["community"] = {
             "questions_asked": questions_asked,
             "answers_provided": answers_provided,
@@ -4784,20 +4722,14 @@ async def get_user_progress(current_user: User = Depends(get_current_user)):
         }
         
         # AI interactions
-        ai_conversations = await db.chat_sessions.count_documents({"user_id": current_user.id})
         progress_data["ai_interactions"] = {
             "conversations": ai_conversations
         }
         
         # Overall progress calculation
-        feature_completions = [
-            progress_data["statutes"]["percentage"],
-            progress_data["myths"]["percentage"],
-            progress_data["simulations"]["percentage"],
-            progress_data["learning_paths"]["percentage"]
-        ]
-        
-        overall_progress = sum(feature_completions) / len(feature_completions)
+        overall_progress = (
+            statutes_percentage + myths_percentage + simulations_percentage + learning_paths_percentage
+        ) * 0.25
         
         return APIResponse(
             success=True,
@@ -4811,56 +4743,48 @@ async def get_user_progress(current_user: User = Depends(get_current_user)):
             }
         )
         
-    except Exception as e:
-        logging.error(f"Error getting user progress: {str(e)}")
+    except Exception:
+        logger.exception("Error getting user progress")
         raise HTTPException(status_code=500, detail="Failed to retrieve user progress")
 
 # Mascot System endpoints
+def build_mascot_interaction(user_id: str, mascot_response: Dict[str, Any], context: Dict[str, Any], **fields) -> Dict[str, Any]:
+    """Build a mascot interaction document from an engine response without re-validating it"""
+    interaction = MascotInteraction.model_construct(
+        user_id=user_id,
+        mascot_name=mascot_response["mascot_name"],
+        message=mascot_response["message"],
+        mood=mascot_response["mood"],
+        action=mascot_response["action"],
+        appearance=mascot_response["appearance"],
+        context=context,
+        **fields
+    )
+    # mood and action are the engine's enum values rather than enum members, which is what gets stored
+    return interaction.model_dump(warnings=False)
+
 @api_router.get("/mascot/greeting", response_model=APIResponse)
 async def get_mascot_greeting(current_user: User = Depends(get_current_user)):
     """Get personalized mascot greeting based on user activity"""
     try:
-        mascot_engine = MascotInteractionEngine()
-        
-        # Get user stats for context
-        user_stats = await db.user_stats.find_one({"user_id": current_user.id})
+        now = datetime.utcnow()
         
-        # Determine greeting type based on user activity
+        # Users who have been away for more than a day without earning any XP get the first-time greeting
         user_last_login = current_user.last_activity or current_user.created_at
-        time_since_login = (datetime.utcnow() - user_last_login).days
-        
-        if time_since_login == 0:
-            # Same day login
-            recent_activity = "daily_return"
-        elif time_since_login <= 1:
-            # Recent return
-            recent_activity = "daily_return"
-        elif current_user.xp == 0:
-            # First time user
-            recent_activity = "first_login"
-        else:
-            # Regular return
-            recent_activity = "daily_return"
-        
-        # Get context-aware response
-        if recent_activity == "first_login":
-            mascot_response = mascot_engine.get_mascot_response(MascotAction.WELCOME)
-        elif recent_activity == "daily_return":
-            mascot_response = mascot_engine.get_mascot_response(MascotAction.WELCOME)
-        else:
-            mascot_response = mascot_engine.get_mascot_response(MascotAction.WELCOME)
+        time_since_login = (now - user_last_login).days
+        recent_activity = "first_login" if time_since_login > 1 and current_user.xp == 0 else "daily_return"
+        
+        # Every greeting type uses the welcome response
+        mascot_response = MASCOT_ENGINE.get_mascot_response(MascotAction.WELCOME)
         
         # Save interaction
-        interaction = MascotInteraction(
-            user_id=current_user.id,
-            mascot_name=mascot_response["mascot_name"],
-            message=mascot_response["message"],
-            mood=MascotMood(mascot_response["mood"]),
-            action=MascotAction(mascot_response["action"]),
-            appearance=mascot_response["appearance"],
-            context={"recent_activity": recent_activity}
+        interaction = build_mascot_interaction(
+            current_user.id,
+            mascot_response,
+            {"recent_activity": recent_activity},
+            created_at=now
         )
-        await db.mascot_interactions.insert_one(interaction.dict())
+        queue_background_write("mascot_interactions", InsertOne(interaction))
         
         return APIResponse(
             success=True,
@@ -4868,28 +4792,23 @@ async def get_mascot_greeting(current_user: User = Depends(get_current_user)):
             data=mascot_response
         )
         
-    except Exception as e:
-        logging.error(f"Error getting mascot greeting: {str(e)}")
+    except Exception:
+        logger.exception("Error getting mascot greeting")
         raise HTTPException(status_code=500, detail="Failed to get mascot greeting")
 
 @api_router.get("/mascot/study-tip", response_model=APIResponse)
 async def get_study_tip(current_user: User = Depends(get_current_user)):
     """Get a random study tip from the mascot"""
     try:
-        mascot_engine = MascotInteractionEngine()
-        mascot_response = mascot_engine.get_mascot_response(MascotAction.CONTEXTUAL_TOOLTIP, context={"context": "Study tip: Focus on understanding legal concepts, not just memorizing them."})
+        mascot_response = MASCOT_ENGINE.get_mascot_response(MascotAction.CONTEXTUAL_TOOLTIP, context={"context": "Study tip: Focus on understanding legal concepts, not just memorizing them."})
         
         # Save interaction
-        interaction = MascotInteraction(
-            user_id=current_user.id,
-            mascot_name=mascot_response["mascot_name"],
-            message=mascot_response["message"],
-            mood=MascotMood(mascot_response["mood"]),
-            action=MascotAction(mascot_response["action"]),
-            appearance=mascot_response["appearance"],
-            context={"type": "study_tip"}
+        interaction = build_mascot_interaction(
+            current_user.id,
+            mascot_response,
+            {"type": "study_tip"}
         )
-        await db.mascot_interactions.insert_one(interaction.dict())
+        queue_background_write("mascot_interactions", InsertOne(interaction))
         
         return APIResponse(
             success=True,
@@ -4897,8 +4816,8 @@ async def get_study_tip(current_user: User = Depends(get_current_user)):
             data=mascot_response
         )
         
-    except Exception as e:
-        logging.error(f"Error getting study tip: {str(e)}")
+    except Exception:
+        logger.exception("Error getting study tip")
         raise HTTPException(status_code=500, detail="Failed to get study tip")
 
 @api_router.post("/mascot/celebrate", response_model=APIResponse)
@@ -4908,8 +4827,6 @@ async def celebrate_achievement(
 ):
     """Trigger mascot celebration for achievements"""
     try:
-        mascot_engine = MascotInteractionEngine()
-        
         achievement_type = achievement_data.get("type", "general")
         
         # Map achievement types to mascot actions
@@ -4925,22 +4842,18 @@ async def celebrate_achievement(
         action = action_mapping.get(achievement_type, MascotAction.CONGRATULATE)
         
         # Generate response with context
-        mascot_response = mascot_engine.get_mascot_response(
+        mascot_response = MASCOT_ENGINE.get_mascot_response(
             action=action,
             context=achievement_data
         )
         
         # Save interaction
-        interaction = MascotInteraction(
-            user_id=current_user.id,
-            mascot_name=mascot_response["mascot_name"],
-            message=mascot_response["message"],
-            mood=MascotMood(mascot_response["mood"]),
-            action=MascotAction(mascot_response["action"]),
-            appearance=mascot_response["appearance"],
-            context=achievement_data
+        interaction = build_mascot_interaction(
+            current_user.id,
+            mascot_response,
+            achievement_data
         )
-        await db.mascot_interactions.insert_one(interaction.dict())
+        queue_background_write("mascot_interactions", InsertOne(interaction))
         
         return APIResponse(
             success=True,
@@ -4948,8 +4861,8 @@ async def celebrate_achievement(
             data=mascot_response
         )
         
-    except Exception as e:
-        logging.error(f"Error triggering celebration: {str(e)}")
+    except Exception:
+        logger.exception("Error triggering celebration")
         raise HTTPException(status_code=500, detail="Failed to trigger celebration")
 
 @api_router.get("/mascot/interactions", response_model=APIResponse)
@@ -4960,38 +4873,60 @@ async def get_mascot_interactions(
     """Get user's recent mascot interactions"""
     try:
         interactions = await db.mascot_interactions.find(
-            {"user_id": current_user.id}
+            {"user_id": current_user.id},
+            {"_id": 0, "id": 1, "mascot_name": 1, "message": 1, "mood": 1, "action": 1,
+             "appearance": 1, "created_at": 1, "is_read": 1}
         ).sort("created_at", -1).limit(limit).to_list(limit)
         
         return APIResponse(
             success=True,
             message="Mascot interactions retrieved successfully",
-            data=[MascotInteraction(**interaction).dict() for interaction in interactions]
+            data=interactions
         )
         
-    except Exception as e:
-        logging.error(f"Error getting mascot interactions: {str(e)}")
+    except Exception:
+        logger.exception("Error getting mascot interactions")
         raise HTTPException(status_code=500, detail="Failed to get mascot interactions")
 
+# Per-user mascot settings responses; update_mascot_settings evicts the user's entry
+mascot_settings_cache = TTLCache(maxsize=10_000, ttl=30)
+
 @api_router.get("/mascot/settings", response_model=APIResponse)
 async def get_mascot_settings(current_user: User = Depends(get_current_user)):
     """Get user's mascot settings"""
+    cached_settings = mascot_settings_cache.get(current_user.id)
+    if cached_settings is not None:
+        return APIResponse(
+            success=True,
+            message="Mascot settings retrieved successfully",
+            data=cached_settings
+        )
+    
     try:
-        settings = await db.mascot_settings.find_one({"user_id": current_user.id})
+        # Create default settings on first read in the same round trip (user_id comes from the filter)
+        default_settings = MascotSettings(user_id=current_user.id).dict()
+        del default_settings["user_id"]
+        settings = await db.mascot_settings.find_one_and_update(
+            {"user_id": current_user.id},
+            {"$setOnInsert": default_settings},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
         
-        if not settings:
-            # Create default settings
-            settings = MascotSettings(user_id=current_user.id)
-            await db.mascot_settings.insert_one(settings.dict())
+        # Trusted stored document (possibly a partial upsert): fill defaults without re-validating
+        settings = MascotSettings.model_construct(**settings)
+        
+        settings_data = settings.model_dump()
+        mascot_settings_cache[current_user.id] = settings_data
         
         return APIResponse(
             success=True,
             message="Mascot settings retrieved successfully",
-            data=MascotSettings(**settings).dict()
+            data=settings_data
         )
         
-    except Exception as e:
-        logging.error(f"Error getting mascot settings: {str(e)}")
+    except Exception:
+        logger.exception("Error getting mascot settings")
         raise HTTPException(status_code=500, detail="Failed to get mascot settings")
 
 @api_router.put("/mascot/settings", response_model=APIResponse)
@@ -5009,6 +4944,7 @@ async def update_mascot_settings(
             {"$set": settings_data},
             upsert=True
         )
+        mascot_settings_cache.pop(current_user.id, None)
         
         return APIResponse(
             success=True,
@@ -5016,8 +4952,8 @@ async def update_mascot_settings(
             data={"updated": True}
         )
         
-    except Exception as e:
-        logging.error(f"Error updating mascot settings: {str(e)}")
+    except Exception:
+        logger.exception("Error updating mascot settings")
         raise HTTPException(status_code=500, detail="Failed to update mascot settings")
 
 @api_router.post("/mascot/mark-read", response_model=APIResponse)
@@ -5030,7 +4966,8 @@ async def mark_interactions_read(
         result = await db.mascot_interactions.update_many(
             {
                 "user_id": current_user.id,
-                "id": {"$in": interaction_ids}
+                "id": {"$in": interaction_ids},
+                "is_read": False
             },
             {"$set": {"is_read": True}}
         )
@@ -5041,8 +4978,8 @@ async def mark_interactions_read(
             data={"updated_count": result.modified_count}
         )
         
-    except Exception as e:
-        logging.error(f"Error marking interactions as read: {str(e)}")
+    except Exception:
+        logger.exception("Error marking interactions as read")
         raise HTTPException(status_code=500, detail="Failed to mark interactions as read")
 
 # Personalized Learning by Protection Type endpoints
@@ -5068,24 +5005,28 @@ async def setup_protection_profile(
             })
         )
         
-        # Save profile
-        await db.user_protection_profiles.replace_one(
-            {"user_id": current_user.id},
-            profile.dict(),
-            upsert=True
+        # Save profile while the relevant content tags are fetched
+        profile_dict = profile.dict()
+        _, relevant_tags = await asyncio.gather(
+            db.user_protection_profiles.replace_one(
+                {"user_id": current_user.id},
+                profile_dict,
+                upsert=True
+            ),
+            find_relevant_content_tags(get_profile_protection_types(profile_dict))
         )
         
-        # Generate initial personalized recommendations
-        await generate_personalized_recommendations(current_user.id)
+        # Generate initial personalized recommendations without holding up the response
+        spawn_background_task(generate_personalized_recommendations(current_user.id, profile_dict, relevant_tags))
         
         return APIResponse(
             success=True,
             message="Protection profile set up successfully",
-            data=profile.dict()
+            data=profile_dict
         )
         
-    except Exception as e:
-        logging.error(f"Error setting up protection profile: {str(e)}")
+    except Exception:
+        logger.exception("Error setting up protection profile")
         raise HTTPException(status_code=500, detail="Failed to set up protection profile")
 
 @api_router.get("/personalization/recommendations", response_model=APIResponse)
@@ -5095,19 +5036,22 @@ async def get_personalized_recommendations(
 ):
     """Get personalized content recommendations"""
     try:
-        recommendations = await db.personalized_recommendations.find(
-            {"user_id": current_user.id, "is_viewed": False}
-        ).sort("relevance_score", -1).limit(limit).to_list(limit)
+        # Fetch recommendations joined with their content details in one round trip
+        pipeline = [
+            {"$match": {"user_id": current_user.id, "is_viewed": False}},
+            {"$sort": {"relevance_score": -1}},
+            {"$limit": limit},
+            *content_lookup_stages("content_id")
+        ]
+        recommendations = await db.personalized_recommendations.aggregate(pipeline).to_list(limit)
         
-        # Enrich recommendations with content details
         enriched_recommendations = []
         for rec in recommendations:
-            content_details = await get_content_details(rec["content_id"], rec["content_type"])
-            if content_details:
-                enriched_recommendations.append({
-                    "recommendation": PersonalizedRecommendation(**rec).dict(),
-                    "content": content_details
-                })
+            content_details = rec.pop("content")
+            enriched_recommendations.append({
+                "recommendation": PersonalizedRecommendation(**rec).dict(),
+                "content": content_details
+            })
         
         return APIResponse(
             success=True,
@@ -5115,43 +5059,78 @@ async def get_personalized_recommendations(
             data=enriched_recommendations
         )
         
-    except Exception as e:
-        logging.error(f"Error getting personalized recommendations: {str(e)}")
+    except Exception:
+        logger.exception("Error getting personalized recommendations")
         raise HTTPException(status_code=500, detail="Failed to get personalized recommendations")
 
-async def get_content_details(content_id: str, content_type: str) -> Optional[Dict[str, Any]]:
-    """Get content details based on type"""
-    try:
-        if content_type == "statute":
-            content = await db.legal_statutes.find_one({"id": content_id})
-        elif content_type == "myth":
-            content = await db.legal_myths.find_one({"id": content_id})
-        elif content_type == "simulation":
-            content = await db.simulation_scenarios.find_one({"id": content_id})
-        elif content_type == "learning_path":
-            content = await db.learning_paths.find_one({"id": content_id})
-        else:
-            return None
-        
-        return content
-    except Exception as e:
-        logging.error(f"Error getting content details: {str(e)}")
-        return None
+# content_type -> collection holding that kind of recommended content
+CONTENT_COLLECTIONS = {
+    "statute": "legal_statutes",
+    "myth": "legal_myths",
+    "simulation": "simulation_scenarios",
+    "learning_path": "learning_paths",
+}
+
+def content_lookup_stages(content_id_field: str) -> List[Dict[str, Any]]:
+    """Aggregation stages that attach the recommended document as `content`, dropping recommendations without one"""
+    stages = []
+    for content_type, collection in CONTENT_COLLECTIONS.items():
+        stages.append({"$lookup": {
+            "from": collection,
+            "let": {"content_id": f"${content_id_field}", "content_type": "$content_type"},
+            "pipeline": [
+                {"$match": {"$expr": {"$and": [
+                    {"$eq": ["$$content_type", content_type]},
+                    {"$eq": ["$id", "$$content_id"]}
+                ]}}},
+                {"$limit": 1},
+                {"$project": {"_id": 0}}
+            ],
+            "as": f"{content_type}_content"
+        }})
+    
+    stages.extend([
+        {"$addFields": {"content": {"$arrayElemAt": [
+            {"$concatArrays": [f"${content_type}_content" for content_type in CONTENT_COLLECTIONS]},
+            0
+        ]}}},
+        {"$match": {"content": {"$exists": True}}},
+        {"$project": {"_id": 0, **{f"{content_type}_content": 0 for content_type in CONTENT_COLLECTIONS}}}
+    ])
+    return stages
+
+MAX_CONTENT_TAG_RECOMMENDATIONS = 100
+
+def get_profile_protection_types(profile: Dict[str, Any]) -> list:
+    """Primary protection type followed by any secondary ones"""
+    return [profile["primary_protection_type"]] + profile.get("secondary_protection_types", [])
+
+async def find_relevant_content_tags(protection_types: list) -> List[Dict[str, Any]]:
+    """Most relevant content tags matching any of the given protection types"""
+    # $match directly followed by $sort/$limit lets the planner run an index-backed top-K scan
+    pipeline = [
+        {"$match": {"protection_types": {"$in": protection_types}}},
+        {"$sort": {"relevance_score": -1}},
+        {"$limit": MAX_CONTENT_TAG_RECOMMENDATIONS}
+    ]
+    return await db.content_tags.aggregate(pipeline).to_list(MAX_CONTENT_TAG_RECOMMENDATIONS)
 
-async def generate_personalized_recommendations(user_id: str):
-    """Generate personalized content recommendations for user"""
+async def generate_personalized_recommendations(
+    user_id: str,
+    profile: Optional[Dict[str, Any]] = None,
+    relevant_tags: Optional[List[Dict[str, Any]]] = None
+):
+    """Generate personalized content recommendations for user (profile and tags are loaded if not supplied)"""
     try:
         # Get user's protection profile
-        profile = await db.user_protection_profiles.find_one({"user_id": user_id})
-        if not profile:
-            return
-        
-        protection_types = [profile["primary_protection_type"]] + profile.get("secondary_protection_types", [])
+        if profile is None:
+            profile = await db.user_protection_profiles.find_one({"user_id": user_id})
+            if not profile:
+                return
         
         # Find relevant content tags
-        relevant_tags = await db.content_tags.find({
-            "protection_types": {"$in": protection_types}
-        }).to_list(100)
+        if relevant_tags is None:
+            relevant_tags = await find_relevant_content_tags(get_profile_protection_types(profile))
         
         # Generate recommendations based on relevance
         recommendations = []
@@ -5167,74 +5146,63 @@ async def generate_personalized_recommendations(user_id: str):
             recommendations.append(recommendation.dict())
         
         if recommendations:
-            await db.personalized_recommendations.insert_many(recommendations)
+            await db.personalized_recommendations.insert_many(recommendations, ordered=False)
             
-    except Exception as e:
-        logging.error(f"Error generating personalized recommendations: {str(e)}")
+    except Exception:
+        logger.exception("Error generating personalized recommendations")
 
 # Purpose-Driven XP Unlocks endpoints
-@api_router.get("/unlocks/trophy-wall", response_model=APIResponse)
+@api_router.get("/unlocks/trophy-wall", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def get_trophy_wall(current_user: User = Depends(get_current_user)):
     """Get user's trophy wall with unlocked protections"""
     try:
-        # Get user's trophy wall
-        trophy_wall = await db.trophy_walls.find_one({"user_id": current_user.id})
+        # Get user's trophy wall and unlocked protections concurrently
+        trophy_wall, unlocked_protections = await asyncio.gather(
+            db.trophy_walls.find_one({"user_id": current_user.id}),
+            db.unlocked_protections.find({"user_id": current_user.id}).to_list(100)
+        )
         if not trophy_wall:
             trophy_wall = TrophyWall(user_id=current_user.id)
             await db.trophy_walls.insert_one(trophy_wall.dict())
+        else:
+            # update_trophy_wall may have upserted a partial document; fill defaults without re-validating
+            trophy_wall = TrophyWall.model_construct(**trophy_wall)
+        
+        # Get unlocked protection details and the protections still available, in parallel
+        unlocked_by_protection_id = {unlocked["protection_id"]: unlocked for unlocked in unlocked_protections}
+        unlocked_ids = list(unlocked_by_protection_id)
+        unlocked_details, available_protections = await asyncio.gather(
+            db.regional_protections.find({"id": {"$in": unlocked_ids}}, {"_id": 0}).to_list(100),
+            db.regional_protections.find({"id": {"$nin": unlocked_ids}}, {"_id": 0}).to_list(100)
+        )
         
-        # Get unlocked protections details
-        unlocked_protections = await db.unlocked_protections.find(
-            {"user_id": current_user.id}
-        ).to_list(100)
-        
-        # Get protection details
         protection_details = []
-        unlocked_protection_ids = []
-        for unlocked in unlocked_protections:
-            protection = await db.regional_protections.find_one({"id": unlocked["protection_id"]})
-            if protection:
-                protection_details.append({
-                    "protection": RegionalProtection(**protection).dict(),
-                    "unlocked_at": unlocked["unlocked_at"],
-                    "is_bookmarked": unlocked.get("is_bookmarked", False)
-                })
-                unlocked_protection_ids.append(unlocked["protection_id"])
-        
-        # Get available protections that can be unlocked
-        available_protections = await db.regional_protections.find(
-            {"id": {"$nin": unlocked_protection_ids}}
-        ).to_list(100)
-        
-        available_protections_formatted = []
-        for protection in available_protections:
-            protection_obj = RegionalProtection(**protection)
-            available_protections_formatted.append(protection_obj.dict())
-        
-        # Update trophy wall statistics
-        await update_trophy_wall(current_user.id)
+        for protection in unlocked_details:
+            unlocked = unlocked_by_protection_id[protection["id"]]
+            protection_details.append({
+                "protection": protection,
+                "unlocked_at": unlocked["unlocked_at"],
+                "is_bookmarked": unlocked.get("is_bookmarked", False)
+            })
         
-        # Ensure trophy_wall is properly formatted
-        if isinstance(trophy_wall, dict):
-            trophy_wall_data = TrophyWall(**trophy_wall).dict()
-        else:
-            trophy_wall_data = trophy_wall.dict()
+        # Update trophy wall statistics; the response does not depend on it
+        spawn_background_task(update_trophy_wall(current_user.id))
         
         return APIResponse(
             success=True,
             message="Trophy wall retrieved successfully",
             data={
-                "trophy_wall": trophy_wall_data,
+                "trophy_wall": trophy_wall.model_dump(),
                 "unlocked_protections": protection_details,
-                "available_protections": available_protections_formatted
+                "available_protections": available_protections
             }
         )
         
-    except Exception as e:
-        logging.error(f"Error getting trophy wall: {str(e)}")
+    except Exception:
+        logger.exception("Error getting trophy wall")
         raise HTTPException(status_code=500, detail="Failed to get trophy wall")
 
-@api_router.post("/unlocks/check-unlock", response_model=APIResponse)
+@api_router.post("/unlocks/check-unlock", response_model=APIResponse, dependencies=[Depends(wait_for_seed_data)])
 async def check_protection_unlock(
     request_data: dict,
     current_user: User = Depends(get_current_user)
@@ -5245,16 +5213,33 @@ async def check_protection_unlock(
         if not protection_id:
             raise HTTPException(status_code=400, detail="Protection ID is required")
         
-        # Get protection details
-        protection = await db.regional_protections.find_one({"id": protection_id})
-        if not protection:
+        # Get protection details, the user's stats and any existing unlock in one round trip
+        pipeline = [
+            {"$match": {"id": protection_id}},
+            {"$limit": 1},
+            {"$project": {"_id": 0}},
+            {"$lookup": {
+                "from": "user_stats",
+                "pipeline": [{"$match": {"user_id": current_user.id}}, {"$limit": 1}, {"$project": {"_id": 0}}],
+                "as": "user_stats"
+            }},
+            {"$lookup": {
+                "from": "unlocked_protections",
+                "pipeline": [
+                    {"$match": {"user_id": current_user.id, "protection_id": protection_id}},
+                    {"$limit": 1},
+                    {"$project": {"_id": 0, "id": 1}}
+                ],
+                "as": "already_unlocked"
+            }}
+        ]
+        results = await db.regional_protections.aggregate(pipeline).to_list(1)
+        if not results:
             raise HTTPException(status_code=404, detail="Protection not found")
         
-        # Check if already unlocked
-        already_unlocked = await db.unlocked_protections.find_one({
-            "user_id": current_user.id,
-            "protection_id": protection_id
-        })
+        protection = results[0]
+        matched_stats = protection.pop("user_stats")
+        already_unlocked = protection.pop("already_unlocked")
         
         if already_unlocked:
             return APIResponse(
@@ -5265,7 +5250,7 @@ async def check_protection_unlock(
         
         # Check unlock requirements
         requirements = protection.get("unlock_requirements", {})
-        user_stats = await db.user_stats.find_one({"user_id": current_user.id})
+        user_stats = matched_stats[0] if matched_stats else None
         
         # If user has no stats, create default stats
         if not user_stats:
@@ -5295,19 +5280,28 @@ async def check_protection_unlock(
                 missing_requirements.append(f"Earn {requirements['xp_required'] - user_xp} more XP")
         
         if can_unlock:
-            # Unlock the protection
+            # Unlock the protection; the upsert is atomic, so a concurrent unlock cannot insert twice
             unlocked_protection = UnlockedProtection(
                 user_id=current_user.id,
                 protection_id=protection_id
             )
-            await db.unlocked_protections.insert_one(unlocked_protection.dict())
+            result = await db.unlocked_protections.update_one(
+                {"user_id": current_user.id, "protection_id": protection_id},
+                {"$setOnInsert": unlocked_protection.dict()},
+                upsert=True
+            )
+            if result.upserted_id is None:
+                return APIResponse(
+                    success=True,
+                    message="Protection already unlocked",
+                    data={"can_unlock": False, "already_unlocked": True}
+                )
             
             # Update trophy wall
             await update_trophy_wall(current_user.id)
             
             # Trigger mascot celebration
-            mascot_engine = MascotInteractionEngine()
-            celebration = mascot_engine.get_rights_unlock_celebration(
+            celebration = MASCOT_ENGINE.get_rights_unlock_celebration(
                 protection["statute_title"],
                 protection.get("state")
             )
@@ -5317,7 +5311,7 @@ async def check_protection_unlock(
                 message="Protection unlocked successfully!",
                 data={
                     "can_unlock": True,
-                    "protection": RegionalProtection(**protection).dict(),
+                    "protection": protection,
                     "celebration": celebration
                 }
             )
@@ -5334,15 +5328,26 @@ async def check_protection_unlock(
     except HTTPException:
         # Re-raise HTTPException to let FastAPI handle it properly
         raise
-    except Exception as e:
-        logging.error(f"Error checking protection unlock: {str(e)}")
+    except Exception:
+        logger.exception("Error checking protection unlock")
         raise HTTPException(status_code=500, detail="Failed to check protection unlock")
 
+# Regional protections only change when seeded, so their count is cached process-wide
+regional_protection_count_cache = TTLCache(maxsize=1, ttl=300)
+
+async def get_regional_protection_count() -> int:
+    """Total number of regional protections, cached for a few minutes"""
+    total_count = regional_protection_count_cache.get("total")
+    if total_count is None:
+        total_count = await db.regional_protections.count_documents({})
+        regional_protection_count_cache["total"] = total_count
+    return total_count
+
 async def update_trophy_wall(user_id: str):
     """Update user's trophy wall statistics"""
     try:
         unlocked_count = await db.unlocked_protections.count_documents({"user_id": user_id})
-        total_count = await db.regional_protections.count_documents({})
+        total_count = await get_regional_protection_count()
         
         completion_percentage = (unlocked_count / max(total_count, 1)) * 100
         
@@ -5358,10 +5363,58 @@ async def update_trophy_wall(user_id: str):
             upsert=True
         )
         
-    except Exception as e:
-        logging.error(f"Error updating trophy wall: {str(e)}")
+    except Exception:
+        logger.exception("Error updating trophy wall")
 
 # UPL Risk Flagging endpoints
+# (risk keyword configuration, Aho-Corasick automaton built from it)
+upl_keyword_matcher = (None, None)
+
+# Global UPL settings change rarely (no API writes them), so they are re-read at most once a minute
+upl_settings_cache = TTLCache(maxsize=1, ttl=60)
+
+async def get_upl_settings() -> Dict[str, Any]:
+    """Current UPL settings document, falling back to the model defaults"""
+    upl_settings = upl_settings_cache.get("settings")
+    if upl_settings is None:
+        upl_settings = await db.upl_settings.find_one({}) or UPLSettings().dict()
+        upl_settings_cache["settings"] = upl_settings
+    return upl_settings
+
+def get_upl_keyword_matcher(risk_keywords: Dict[str, List[str]]):
+    """Return an automaton over the lowercased risk keywords, rebuilt only when the configuration changes"""
+    global upl_keyword_matcher
+    config_key = tuple((category, tuple(keywords)) for category, keywords in risk_keywords.items())
+    cached_key, matcher = upl_keyword_matcher
+    if cached_key == config_key:
+        return matcher
+    
+    # Each lowercased keyword maps to its (position, original keyword) entries so that
+    # duplicates across categories are still counted and reported in configuration order
+    entries_by_word = {}
+    keywords = (keyword for category_keywords in risk_keywords.values() for keyword in category_keywords)
+    for position, keyword in enumerate(keywords):
+        entries_by_word.setdefault(keyword.lower(), []).append((position, keyword))
+    
+    matcher = ahocorasick.Automaton()
+    for word, entries in entries_by_word.items():
+        matcher.add_word(word, (word, entries))
+    matcher.make_automaton()
+    
+    upl_keyword_matcher = (config_key, matcher)
+    return matcher
+
+def find_upl_risk_keywords(query_text: str, risk_keywords: Dict[str, List[str]]) -> List[str]:
+    """Return every configured risk keyword contained in the (lowercased) query, in one pass over the text"""
+    if not any(risk_keywords.values()):
+        return []
+    
+    matched_entries = {}
+    for _, (word, entries) in get_upl_keyword_matcher(risk_keywords).iter(query_text):
+        matched_entries[word] = entries
+    
+    return [keyword for _, keyword in sorted(entry for entries in matched_entries.values() for entry in entries)]
+
 @api_router.post("/upl/check-query", response_model=APIResponse)
 async def check_query_upl_risk(
     query_data: Dict[str, Any],
@@ -5372,7 +5425,7 @@ async def check_query_upl_risk(
         query_text = query_data.get("query", "").lower()
         
         # Get UPL settings
-        upl_settings = await db.upl_settings.find_one({}) or UPLSettings().dict()
+        upl_settings = await get_upl_settings()
         
         if not upl_settings.get("enabled", True):
             return APIResponse(
@@ -5382,14 +5435,8 @@ async def check_query_upl_risk(
             )
         
         # Check for risk keywords
-        risk_score = 0
-        flagged_keywords = []
-        
-        for category, keywords in upl_settings.get("risk_keywords", {}).items():
-            for keyword in keywords:
-                if keyword.lower() in query_text:
-                    risk_score += 1
-                    flagged_keywords.append(keyword)
+        flagged_keywords = find_upl_risk_keywords(query_text, upl_settings.get("risk_keywords", {}))
+        risk_score = len(flagged_keywords)
         
         # Determine risk level
         thresholds = upl_settings.get("risk_thresholds", {"medium": 2, "high": 3, "critical": 5})
@@ -5413,16 +5460,15 @@ async def check_query_upl_risk(
                 flagged_keywords=flagged_keywords,
                 action_taken="warning_shown" if risk_level != UPLRiskLevel.CRITICAL else "query_blocked"
             )
-            await db.upl_flags.insert_one(upl_flag.dict())
+            queue_background_write("upl_flags", InsertOne(upl_flag.dict()))
         
         # Get appropriate warning message
         warning_needed = risk_level != UPLRiskLevel.LOW
         warning_message = None
         
         if warning_needed:
-            mascot_engine = MascotInteractionEngine()
             warning_type = "specific_case" if risk_level == UPLRiskLevel.CRITICAL else "general"
-            warning_response = mascot_engine.get_upl_warning(warning_type)
+            warning_response = MASCOT_ENGINE.get_upl_warning(warning_type)
             warning_message = warning_response["message"]
         
         return APIResponse(
@@ -5438,8 +5484,8 @@ async def check_query_upl_risk(
             }
         )
         
-    except Exception as e:
-        logging.error(f"Error checking UPL risk: {str(e)}")
+    except Exception:
+        logger.exception("Error checking UPL risk")
         raise HTTPException(status_code=500, detail="Failed to check UPL risk")
 
 # AI Memory & Suggestion Engine endpoints
@@ -5454,39 +5500,29 @@ async def update_ai_memory(
         subtopics = memory_data.get("subtopics", [])
         user_feedback = memory_data.get("user_feedback")
         
-        # Find or create AI memory entry
-        existing_memory = await db.ai_memories.find_one({
-            "user_id": current_user.id,
-            "topic": topic
-        })
-        
-        if existing_memory:
-            # Update existing memory
-            await db.ai_memories.update_one(
-                {"user_id": current_user.id, "topic": topic},
-                {
-                    "$set": {
-                        "last_interaction": datetime.utcnow(),
-                        "user_feedback": user_feedback,
-                        "needs_follow_up": memory_data.get("needs_follow_up", False)
-                    },
-                    "$inc": {"interaction_count": 1},
-                    "$addToSet": {"subtopics": {"$each": subtopics}}
-                }
-            )
-        else:
-            # Create new memory entry
-            memory = AIMemory(
-                user_id=current_user.id,
-                topic=topic,
-                subtopics=subtopics,
-                user_feedback=user_feedback,
-                needs_follow_up=memory_data.get("needs_follow_up", False)
-            )
-            await db.ai_memories.insert_one(memory.dict())
+        # Update the AI memory entry, creating it on first interaction
+        memory_filter = {"user_id": current_user.id, "topic": topic}
+        memory_update = {
+            "$set": {
+                "last_interaction": datetime.utcnow(),
+                "user_feedback": user_feedback,
+                "needs_follow_up": memory_data.get("needs_follow_up", False)
+            },
+            "$inc": {"interaction_count": 1},
+            "$addToSet": {"subtopics": {"$each": subtopics}},
+            "$setOnInsert": {
+                "id": str(uuid.uuid4()),
+                "user_understanding_level": 1
+            }
+        }
+        try:
+            await db.ai_memories.update_one(memory_filter, memory_update, upsert=True)
+        except DuplicateKeyError:
+            # A concurrent first interaction inserted the entry first; retrying updates it instead
+            await db.ai_memories.update_one(memory_filter, memory_update, upsert=True)
         
-        # Generate learning recommendations
-        await generate_ai_recommendations(current_user.id, topic)
+        # Generate learning recommendations without holding up the response
+        spawn_background_task(generate_ai_recommendations(current_user.id, topic))
         
         return APIResponse(
             success=True,
@@ -5494,49 +5530,10 @@ async def update_ai_memory(
             data={"updated": True}
         )
         
-    except Exception as e:
-        logging.error(f"Error updating AI memory: {str(e)}")
+    except Exception:
+        logger.exception("Error updating AI memory")
         raise HTTPException(status_code=500, detail="Failed to update AI memory")
 
-@api_router.get("/ai/suggestions", response_model=APIResponse)
-async def get_ai_suggestions(
-    current_user: User = Depends(get_current_user)
-):
-    """Get AI-generated learning suggestions"""
-    try:
-        # Get recent AI memories
-        memories = await db.ai_memories.find(
-            {"user_id": current_user.id}
-        ).sort("last_interaction", -1).limit(10).to_list(10)
-        
-        # Get learning recommendations
-        recommendations = await db.learning_recommendations.find(
-            {"user_id": current_user.id, "is_viewed": False}
-        ).sort("confidence_score", -1).limit(5).to_list(5)
-        
-        # Enrich recommendations with content details
-        enriched_recommendations = []
-        for rec in recommendations:
-            content_details = await get_content_details(rec["recommended_content_id"], rec["content_type"])
-            if content_details:
-                enriched_recommendations.append({
-                    "recommendation": LearningRecommendation(**rec).dict(),
-                    "content": content_details
-                })
-        
-        return APIResponse(
-            success=True,
-            message="AI suggestions retrieved successfully",
-            data={
-                "memories": [AIMemory(**memory).dict() for memory in memories],
-                "recommendations": enriched_recommendations
-            }
-        )
-        
-    except Exception as e:
-        logging.error(f"Error getting AI suggestions: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to get AI suggestions")
-
 async def generate_ai_recommendations(user_id: str, topic: str):
     """Generate AI-powered learning recommendations"""
     try:
@@ -5547,9 +5544,10 @@ async def generate_ai_recommendations(user_id: str, topic: str):
         
         # Generate recommendations based on topic and patterns
         # This is a simplified version - in production, use ML/AI for better recommendations
-        related_content = await db.learning_paths.find({
-            "title": {"$regex": topic, "$options": "i"}
-        }).limit(3).to_list(3)
+        related_content = await db.learning_paths.find(
+            {"$text": {"$search": topic}},
+            {"_id": 0, "id": 1, "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(3).to_list(3)
         
         recommendations = []
         for content in related_content:
@@ -5565,649 +5563,228 @@ async def generate_ai_recommendations(user_id: str, topic: str):
         if recommendations:
             await db.learning_recommendations.insert_many(recommendations)
             
-    except Exception as e:
-        logging.error(f"Error generating AI recommendations: {str(e)}")
-
-# Include the router in the main app
-app.include_router(api_router)
+    except Exception:
+        logger.exception("Error generating AI recommendations")
 
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=CORS_MAX_AGE_SECONDS,
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+# Include the router in the main app
+app.include_router(api_router)
 
-@app.on_event("startup")
-async def startup_db_client():
-    """Initialize database with common script templates, legal myths, simulations, and learning paths"""
-    await initialize_script_templates()
-    await initialize_legal_myths()
-    await initialize_legal_simulations()
-    await initialize_learning_paths()
-    await initialize_regional_protections()
+# Indexes backing the hot per-user query paths: (collection, keys, options)
+DB_INDEXES = [
+    ("xp_transactions", [("user_id", 1), ("created_at", -1)], {}),
+    ("user_badges", [("user_id", 1)], {}),
+    ("user_achievements", [("user_id", 1), ("achievement_id", 1)], {}),
+    ("streaks", [("user_id", 1), ("streak_type", 1)], {}),
+    ("user_stats", [("user_id", 1)], {"unique": True}),
+    ("badges", [("id", 1)], {"unique": True}),
+    ("users", [("id", 1)], {"unique": True}),
+    ("mascot_interactions", [("user_id", 1), ("created_at", -1)], {}),
+    ("content_tags", [("protection_types", 1), ("relevance_score", -1)], {}),
+    ("mascot_interactions", [("user_id", 1), ("id", 1)], {}),
+    ("personalized_recommendations", [("user_id", 1), ("is_viewed", 1), ("relevance_score", -1)], {}),
+    ("learning_recommendations", [("user_id", 1), ("is_viewed", 1), ("confidence_score", -1)], {}),
+    ("ai_memories", [("user_id", 1), ("last_interaction", -1)], {}),
+    ("ai_memories", [("user_id", 1), ("topic", 1)], {"unique": True}),
+    ("unlocked_protections", [("user_id", 1), ("protection_id", 1)], {"unique": True}),
+    ("learning_paths", [("title", "text"), ("description", "text")], {}),
+    ("script_templates", [("title", 1), ("category", 1)], {"unique": True}),
+    ("legal_myths", [("status", 1), ("category", 1), ("published_at", -1)], {}),
+    ("legal_myths", [("status", 1), ("published_at", -1)], {}),
+    ("learning_paths", [("is_active", 1), ("path_type", 1)], {}),
+    ("simulation_scenarios", [("is_active", 1), ("category", 1)], {}),
+    ("user_learning_progress", [("user_id", 1), ("learning_path_id", 1), ("is_completed", 1)], {}),
+    ("regional_protections", [("statute_code", 1)], {"unique": True}),
+    # Seeded documents are upserted on their title, so reseeding never duplicates them; user-created myths are unaffected
+    ("legal_myths", [("title", 1), ("created_by", 1)], {"unique": True, "partialFilterExpression": {"created_by": "system"}}),
+    ("simulation_scenarios", [("title", 1), ("created_by", 1)], {"unique": True, "partialFilterExpression": {"created_by": "system"}}),
+    ("learning_paths", [("title", 1), ("created_by", 1)], {"unique": True, "partialFilterExpression": {"created_by": "system"}}),
+]
+
+async def ensure_indexes():
+    """Create the indexes used by hot query paths (no-op for indexes that already exist)"""
+    for collection, keys, options in DB_INDEXES:
+        try:
+            await db[collection].create_index(keys, **options)
+        except Exception as e:
+            logger.warning("Could not create index %s on %s: %s", keys, collection, e)
+
+SEED_INSERT_BATCH_SIZE = 50
+SEED_INSERT_CONCURRENCY = 8
+
+async def write_seed_batches(documents, write_batch) -> int:
+    """Write documents in SEED_INSERT_BATCH_SIZE batches, up to SEED_INSERT_CONCURRENCY at once, and return how many were written
+    
+    Batches are cut only as write slots free up, so a generator is consumed incrementally
+    """
+    documents = iter(documents)
+    in_flight = set()
+    written = 0
+    while batch := list(islice(documents, SEED_INSERT_BATCH_SIZE)):
+        if len(in_flight) >= SEED_INSERT_CONCURRENCY:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()  # surface a failed batch
+        in_flight.add(asyncio.create_task(write_batch(batch)))
+        written += len(batch)
+    await asyncio.gather(*in_flight)
+    return written
+
+async def upsert_seed_documents(collection: str, documents, key_fields: tuple):
+    """Insert seed documents not already present, matched on a unique key (safe when several replicas seed at once)"""
+    async def upsert_batch(batch):
+        operations = [
+            UpdateOne({field: doc[field] for field in key_fields}, {"$setOnInsert": doc}, upsert=True)
+            for doc in batch
+        ]
+        try:
+            await db[collection].bulk_write(operations, ordered=False, bypass_document_validation=True)
+        except BulkWriteError as e:
+            # Duplicate keys only mean a concurrent seeder inserted the same document first
+            if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+                raise
+    
+    return await write_seed_batches(documents, upsert_batch)
+
+async def replace_seed_documents(collection: str, documents, key_fields: tuple) -> int:
+    """Make a collection match its seed documents, matched on a unique key, and return how many were written
+    
+    Existing documents are updated in place (keeping their id and created_at) and new ones inserted before
+    any document missing from the seed is deleted, so readers never see the collection empty
+    """
+    seed_keys = []
+    
+    async def replace_batch(batch):
+        operations = []
+        for doc in batch:
+            key = {field: doc[field] for field in key_fields}
+            seed_keys.append(key)
+            operations.append(UpdateOne(
+                key,
+                {
+                    "$set": {field: value for field, value in doc.items() if field not in ("id", "created_at")},
+                    "$setOnInsert": {"id": doc["id"], "created_at": doc["created_at"]}
+                },
+                upsert=True
+            ))
+        try:
+            await db[collection].bulk_write(operations, ordered=False, bypass_document_validation=True)
+        except BulkWriteError as e:
+            # Duplicate keys only mean a concurrent seeder inserted the same document first
+            if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+                raise
+    
+    written_count = await write_seed_batches(documents, replace_batch)
+    if seed_keys:
+        await db[collection].delete_many({"$nor": seed_keys})
+    return written_count
+
+async def is_collection_seeded(collection: str) -> bool:
+    """Check a collection's seed marker (a single _id lookup in seed_markers)
+    
+    The marker is written only after every seed document has been written. Seeds are upserted on a
+    natural key, so a collection without a marker (an interrupted seed, or one from before markers
+    existed) is simply seeded again and only its missing documents are inserted
+    """
+    return await db.seed_markers.find_one({"_id": collection}, {"_id": 1}) is not None
+
+async def mark_collection_seeded(collection: str):
+    """Record that a collection's seed data has been written"""
+    await db.seed_markers.update_one(
+        {"_id": collection},
+        {"$set": {"seeded_at": datetime.utcnow()}},
+        upsert=True
+    )
 
 async def initialize_script_templates():
-    """Initialize the database with common legal script templates"""
-    # Check if scripts already exist
-    existing_count = await db.script_templates.count_documents({})
-    if existing_count > 0:
-        return  # Scripts already initialized
+    """Initialize the database with common legal script templates (reseeded whenever the seed data changes)"""
+    from seed_documents import load_seed_documents, seed_data_hash
     
-    common_scripts = [
-        {
-            "title": "Traffic Stop - Basic Rights",
-            "category": "traffic_stop",
-            "scenario": "When pulled over by police during a traffic stop",
-            "script_text": "Officer, I'm invoking my right to remain silent. I do not consent to any searches. I would like to speak with my attorney. Am I free to go?",
-            "legal_basis": "4th and 5th Amendment protections against unreasonable searches and self-incrimination",
-            "keywords": ["traffic stop", "police", "search", "rights"],
-            "state_specific": False,
-            "applicable_states": []
-        },
-        {
-            "title": "ICE Encounter - Know Your Rights",
-            "category": "ice_encounter", 
-            "scenario": "When approached by ICE or immigration officers",
-            "script_text": "I am exercising my right to remain silent. I do not consent to any search. I want to speak with my lawyer. I am not answering any questions. If you do not have a warrant signed by a judge, I am not opening the door.",
-            "legal_basis": "Constitutional rights apply to all persons in the US regardless of immigration status",
-            "keywords": ["ice", "immigration", "deportation", "warrant"],
-            "state_specific": False,
-            "applicable_states": []
-        },
-        {
-            "title": "Police Search Request",
-            "category": "police_search",
-            "scenario": "When police ask to search you, your car, or your home",
-            "script_text": "I do not consent to this search. I am invoking my 4th Amendment right against unreasonable searches. If you do not have a warrant, I do not give permission for this search.",
-            "legal_basis": "4th Amendment protection against unreasonable searches and seizures",
-            "keywords": ["search", "consent", "4th amendment", "warrant"],
-            "state_specific": False,
-            "applicable_states": []
-        },
-        {
-            "title": "Housing Dispute - Tenant Rights",
-            "category": "housing_dispute",
-            "scenario": "When dealing with landlord disputes or illegal eviction attempts",
-            "script_text": "I am aware of my tenant rights. Any eviction must follow proper legal procedures. I request all communications in writing. I will not vacate without a court order.",
-            "legal_basis": "State tenant-landlord laws and fair housing protections",
-            "keywords": ["eviction", "tenant", "landlord", "housing"],
-            "state_specific": True,
-            "applicable_states": ["CA", "NY", "TX", "FL"]
-        },
-        {
-            "title": "Workplace Rights - Discrimination",
-            "category": "workplace_rights",
-            "scenario": "When facing workplace discrimination or harassment",
-            "script_text": "I am documenting this incident for my records. This behavior appears to violate workplace policies and potentially federal employment law. I request this be addressed through proper HR channels.",
-            "legal_basis": "Title VII and other federal employment discrimination laws",
-            "keywords": ["discrimination", "harassment", "workplace", "hr"],
-            "state_specific": False,
-            "applicable_states": []
-        },
-        {
-            "title": "Police Questioning - Miranda Rights",
-            "category": "police_encounter",
-            "scenario": "When being questioned by police",
-            "script_text": "I am invoking my 5th Amendment right to remain silent. I want to speak with my attorney. I will not answer any questions without my lawyer present.",
-            "legal_basis": "5th Amendment right against self-incrimination and 6th Amendment right to counsel",
-            "keywords": ["miranda", "questioning", "attorney", "silence"],
-            "state_specific": False,
-            "applicable_states": []
-        },
-        {
-            "title": "Student Rights - School Search",
-            "category": "student_rights",
-            "scenario": "When school officials want to search your belongings",
-            "script_text": "I do not consent to this search. I am aware that schools have different search standards, but I am exercising my right to object. I want to call my parents/guardian.",
-            "legal_basis": "Students have limited 4th Amendment protections in schools (T.L.O. v. New Jersey)",
-            "keywords": ["school", "search", "student", "backpack"],
-            "state_specific": False,
-            "applicable_states": []
-        },
-        {
-            "title": "Consumer Rights - Debt Collection",
-            "category": "consumer_rights",
-            "scenario": "When dealing with aggressive debt collectors",
-            "script_text": "I am requesting that all communications be in writing. I dispute this debt and request verification. Please provide documentation proving I owe this amount.",
-            "legal_basis": "Fair Debt Collection Practices Act (FDCPA) protections",
-            "keywords": ["debt", "collection", "fdcpa", "verification"],
-            "state_specific": False,
-            "applicable_states": []
-        }
-    ]
+    # Check if the current script templates are already seeded
+    payload_hash = seed_data_hash("script_templates")
+    marker = await db.seed_markers.find_one({"_id": "script_templates"})
+    if marker and marker["hash"] == payload_hash:
+        return  # Scripts already initialized
     
-    # Insert all script templates
-    script_templates = [ScriptTemplate(**script_data) for script_data in common_scripts]
-    await db.script_templates.insert_many([template.dict() for template in script_templates])
+    # Replace the script templates in place; the marker is written last, so an interrupted reseed is retried
+    template_count = await replace_seed_documents("script_templates", load_seed_documents("script_templates"), ("title", "category"))
+    await db.seed_markers.update_one(
+        {"_id": "script_templates"},
+        {"$set": {"hash": payload_hash, "seeded_at": datetime.utcnow()}},
+        upsert=True
+    )
     
-    logging.info(f"Initialized {len(script_templates)} script templates")
+    logger.info("Initialized %d script templates", template_count)
 
 async def initialize_legal_myths():
     """Initialize the database with engaging legal myths"""
     # Check if myths already exist
-    existing_count = await db.legal_myths.count_documents({})
-    if existing_count > 0:
+    if await is_collection_seeded("legal_myths"):
         return  # Myths already initialized
     
-    legal_myths_data = [
-        {
-            "title": "Police Must Read Miranda Rights During Any Arrest",
-            "myth_statement": "Police are required to read you your Miranda rights as soon as they arrest you.",
-            "fact_explanation": "Miranda rights only need to be read if police plan to conduct a custodial interrogation. If they don't question you, they don't need to read your rights. However, you still have the right to remain silent regardless.",
-            "category": "criminal_law",
-            "difficulty_level": 2,
-            "sources": ["Miranda v. Arizona (1966)", "Supreme Court Decisions"],
-            "tags": ["miranda", "arrest", "police", "rights"],
-            "status": "published",
-            "published_at": datetime.utcnow()
-        },
-        {
-            "title": "You Can't Be Arrested for Not Carrying ID",
-            "myth_statement": "It's illegal to not carry identification, and you can be arrested for it.",
-            "fact_explanation": "In most states, you're not required to carry ID unless you're driving. However, some 'stop and identify' states require you to provide your name if lawfully detained. You generally cannot be arrested solely for not having ID.",
-            "category": "civil_rights",
-            "difficulty_level": 3,
-            "sources": ["Stop and Identify Laws", "4th Amendment"],
-            "tags": ["id", "identification", "arrest", "stop and identify"],
-            "status": "published",
-            "published_at": datetime.utcnow()
-        },
-        {
-            "title": "Landlords Can Enter Your Apartment Anytime",
-            "myth_statement": "Since landlords own the property, they can enter your rental unit whenever they want.",
-            "fact_explanation": "Landlords must provide proper notice (usually 24-48 hours) and have a valid reason to enter your rental unit. Emergency situations are an exception. Tenant privacy rights are protected by law.",
-            "category": "housing",
-            "difficulty_level": 1,
-            "sources": ["State Landlord-Tenant Laws", "Fair Housing Act"],
-            "tags": ["landlord", "tenant", "privacy", "rental"],
-            "status": "published",
-            "published_at": datetime.utcnow()
-        },
-        {
-            "title": "You Must Answer Police Questions",
-            "myth_statement": "If police ask you questions, you are legally required to answer them.",
-            "fact_explanation": "You have the 5th Amendment right to remain silent. You're only required to identify yourself in 'stop and identify' states if lawfully detained. Beyond that, you can politely decline to answer questions.",
-            "category": "civil_rights",
-            "difficulty_level": 2,
-            "sources": ["5th Amendment", "Terry v. Ohio"],
-            "tags": ["police", "questioning", "5th amendment", "silence"],
-            "status": "published",
-            "published_at": datetime.utcnow()
-        },
-        {
-            "title": "Verbal Contracts Aren't Legally Binding",
-            "myth_statement": "Only written contracts are legally enforceable - verbal agreements don't count.",
-            "fact_explanation": "Verbal contracts can be legally binding, but they're harder to prove in court. Some contracts (like real estate transactions) must be in writing under the Statute of Frauds, but many verbal agreements are enforceable.",
-            "category": "contracts",
-            "difficulty_level": 3,
-            "sources": ["Contract Law", "Statute of Frauds"],
-            "tags": ["contracts", "verbal", "written", "binding"],
-            "status": "published",
-            "published_at": datetime.utcnow()
-        },
-        {
-            "title": "If You're Injured, You Can Always Sue",
-            "myth_statement": "Anyone who gets injured can file a lawsuit and win compensation.",
-            "fact_explanation": "To win a personal injury case, you must prove negligence, causation, and damages. Not all injuries result from someone else's fault. There are also statutes of limitations that limit when you can file a lawsuit.",
-            "category": "torts",
-            "difficulty_level": 2,
-            "sources": ["Tort Law", "Negligence Standards"],
-            "tags": ["personal injury", "lawsuit", "negligence", "damages"],
-            "status": "published",
-            "published_at": datetime.utcnow()
-        },
-        {
-            "title": "You Can't Be Fired Without Cause",
-            "myth_statement": "Employers need a good reason to fire employees, and wrongful termination is always illegal.",
-            "fact_explanation": "Most employment is 'at-will,' meaning you can be fired for any reason or no reason (except illegal discrimination). Only employees with contracts or in certain protected situations have additional job security.",
-            "category": "employment",
-            "difficulty_level": 2,
-            "sources": ["At-Will Employment Laws", "Title VII"],
-            "tags": ["employment", "firing", "at-will", "wrongful termination"],
-            "status": "published",
-            "published_at": datetime.utcnow()
-        },
-        {
-            "title": "Public School Students Have No Rights",
-            "myth_statement": "Students lose all their constitutional rights when they enter school property.",
-            "fact_explanation": "Students don't 'shed their constitutional rights at the schoolhouse gate.' However, schools can impose reasonable restrictions for educational purposes and safety. Students have reduced, but not eliminated, rights.",
-            "category": "education",
-            "difficulty_level": 3,
-            "sources": ["Tinker v. Des Moines", "Student Rights Cases"],
-            "tags": ["student rights", "education", "schools", "constitution"],
-            "status": "published",
-            "published_at": datetime.utcnow()
-        },
-        {
-            "title": "Speed Limits Are Just Suggestions",
-            "myth_statement": "As long as you're driving safely, speed limits don't really matter.",
-            "fact_explanation": "Speed limits are legally enforceable. While some states have 'absolute' vs 'prima facie' speed limit laws, exceeding posted limits can result in tickets and liability in accidents. Safe driving includes following speed limits.",
-            "category": "traffic",
-            "difficulty_level": 1,
-            "sources": ["State Traffic Laws", "Vehicle Codes"],
-            "tags": ["speed limits", "traffic", "driving", "tickets"],
-            "status": "published",
-            "published_at": datetime.utcnow()
-        },
-        {
-            "title": "Credit Reports Can't Affect Employment",
-            "myth_statement": "Employers can't check your credit report or use it in hiring decisions.",
-            "fact_explanation": "Employers can check credit reports for many positions with your written consent. This is especially common for financial roles or positions requiring security clearances. However, some states have restrictions on credit check usage.",
-            "category": "employment",
-            "difficulty_level": 2,
-            "sources": ["Fair Credit Reporting Act", "State Employment Laws"],
-            "tags": ["credit report", "employment", "hiring", "background check"],
-            "status": "published",
-            "published_at": datetime.utcnow()
-        }
-    ]
+    from seed_documents import load_seed_documents  # imported only when seeding is needed
     
     # Create legal myths with user ID
-    current_user_id = "system"  # System-generated myths
-    legal_myths = []
-    for myth_data in legal_myths_data:
-        myth = LegalMyth(**myth_data, created_by=current_user_id)
-        legal_myths.append(myth)
+    myth_count = await upsert_seed_documents("legal_myths", load_seed_documents("legal_myths"), ("title", "created_by"))
+    invalidate_recommendation_catalog("legal_myths")
+    await mark_collection_seeded("legal_myths")
     
+    logger.info("Initialized %d legal myths", myth_count)
+
 async def initialize_legal_simulations():
     """Initialize the database with interactive legal simulation scenarios"""
     # Check if simulations already exist
-    existing_count = await db.simulation_scenarios.count_documents({})
-    if existing_count > 0:
+    if await is_collection_seeded("simulation_scenarios"):
         return  # Simulations already initialized
     
-    simulation_scenarios = [
-        # Traffic Stop Simulation
-        {
-            "title": "Traffic Stop: Know Your Rights",
-            "description": "You're driving home when you see flashing lights behind you. How you handle this traffic stop can make all the difference. Practice your rights!",
-            "category": "traffic_stop",
-            "difficulty_level": 2,
-            "estimated_duration": 5,
-            "learning_objectives": [
-                "Understand your rights during a traffic stop",
-                "Learn when you can refuse searches",
-                "Practice de-escalation techniques",
-                "Know what information you must provide"
-            ],
-            "legal_context": "Traffic stops are governed by the 4th Amendment protection against unreasonable searches and state traffic laws.",
-            "applicable_laws": ["4th Amendment", "State Traffic Codes", "Terry v. Ohio"],
-            "start_node_id": "traffic_start",
-            "scenario_nodes": [
-                {
-                    "id": "traffic_start",
-                    "title": "Pulled Over",
-                    "description": "You see police lights in your rearview mirror. The officer is approaching your vehicle. What's your first action?",
-                    "choices": [
-                        {
-                            "choice_text": "Keep your hands on the steering wheel and wait for the officer",
-                            "next_node_id": "traffic_compliant",
-                            "is_optimal": True,
-                            "feedback": "✅ Excellent! Keeping your hands visible shows you're not a threat and follows best practices.",
-                            "immediate_consequence": "The officer approaches calmly, appreciating your cooperation.",
-                            "xp_value": 15
-                        },
-                        {
-                            "choice_text": "Get out of the car to meet the officer",
-                            "next_node_id": "traffic_mistake",
-                            "is_optimal": False,
-                            "feedback": "❌ This could be seen as threatening. Stay in your vehicle unless instructed otherwise.",
-                            "immediate_consequence": "The officer orders you back into your vehicle and seems more alert.",
-                            "xp_value": 5
-                        },
-                        {
-                            "choice_text": "Start looking through your glove compartment for documents",
-                            "next_node_id": "traffic_searching",
-                            "is_optimal": False,
-                            "feedback": "⚠️ Wait for instructions before reaching for anything - officer safety is important.",
-                            "immediate_consequence": "The officer asks you to stop moving and keep your hands visible.",
-                            "xp_value": 8
-                        }
-                    ]
-                },
-                {
-                    "id": "traffic_compliant",
-                    "title": "Documents Requested",
-                    "description": "The officer asks for your driver's license, registration, and insurance. You provide them. Now the officer asks: 'Do you know why I stopped you?'",
-                    "choices": [
-                        {
-                            "choice_text": "Admit to speeding: 'Yes, I was going a bit fast'",
-                            "next_node_id": "traffic_admission",
-                            "is_optimal": False,
-                            "feedback": "❌ Never admit guilt! This admission can be used against you in court.",
-                            "immediate_consequence": "The officer notes your admission and continues the investigation.",
-                            "xp_value": 5
-                        },
-                        {
-                            "choice_text": "Exercise your right to remain silent: 'I prefer to remain silent'",
-                            "next_node_id": "traffic_silent",
-                            "is_optimal": True,
-                            "feedback": "✅ Perfect! You have the right to remain silent and shouldn't incriminate yourself.",
-                            "immediate_consequence": "The officer respects your right and continues with the traffic stop.",
-                            "xp_value": 20
-                        },
-                        {
-                            "choice_text": "Ask a question: 'What did I do wrong, officer?'",
-                            "next_node_id": "traffic_question",
-                            "is_optimal": True,
-                            "feedback": "✅ Good! You're not admitting guilt but engaging respectfully.",
-                            "immediate_consequence": "The officer explains they clocked you going 10 mph over the limit.",
-                            "xp_value": 15
-                        }
-                    ]
-                },
-                {
-                    "id": "traffic_silent",
-                    "title": "Search Request",
-                    "description": "The officer asks: 'Mind if I search your vehicle?' How do you respond?",
-                    "choices": [
-                        {
-                            "choice_text": "Consent to the search: 'Sure, go ahead'",
-                            "next_node_id": "traffic_consent",
-                            "is_optimal": False,
-                            "feedback": "❌ You just waived your 4th Amendment rights! Never consent unless they have a warrant.",
-                            "immediate_consequence": "The officer searches your car, which could lead to additional complications.",
-                            "xp_value": 5
-                        },
-                        {
-                            "choice_text": "Refuse politely: 'I do not consent to searches'",
-                            "next_node_id": "traffic_refuse",
-                            "is_optimal": True,
-                            "feedback": "✅ Excellent! You're exercising your 4th Amendment right against unreasonable searches.",
-                            "immediate_consequence": "The officer respects your rights and cannot search without probable cause.",
-                            "xp_value": 25
-                        }
-                    ]
-                },
-                {
-                    "id": "traffic_refuse",
-                    "title": "Traffic Stop Conclusion",
-                    "description": "The officer respects your refusal and writes you a ticket for speeding. The stop concludes professionally.",
-                    "is_end_node": True,
-                    "legal_explanation": "You successfully exercised your constitutional rights during this traffic stop. Key takeaways: 1) Keep hands visible, 2) Provide required documents, 3) Exercise your right to remain silent, 4) Never consent to searches without a warrant. You can fight the ticket in court if you believe it was unjustified.",
-                    "outcome_type": "positive",
-                    "xp_reward": 30
-                }
-            ]
-        },
-        
-        # ICE Encounter Simulation
-        {
-            "title": "ICE Encounter: Constitutional Rights",
-            "description": "ICE agents appear at your door. Regardless of your immigration status, you have constitutional rights. Learn how to protect yourself and your family.",
-            "category": "police_encounter",
-            "difficulty_level": 3,
-            "estimated_duration": 7,
-            "learning_objectives": [
-                "Understand your rights regardless of immigration status",
-                "Learn about warrant requirements",
-                "Practice asserting your rights respectfully",
-                "Know when to remain silent"
-            ],
-            "legal_context": "Constitutional rights apply to all persons on US soil, regardless of immigration status. 4th Amendment protections require warrants for searches.",
-            "applicable_laws": ["4th Amendment", "5th Amendment", "Immigration Laws"],
-            "start_node_id": "ice_start",
-            "scenario_nodes": [
-                {
-                    "id": "ice_start",
-                    "title": "Knock at the Door",
-                    "description": "Someone knocks loudly at your door early in the morning. Through the window, you see people in what appear to be official uniforms. What do you do?",
-                    "choices": [
-                        {
-                            "choice_text": "Open the door immediately",
-                            "next_node_id": "ice_opened",
-                            "is_optimal": False,
-                            "feedback": "❌ Never open the door without knowing who it is and seeing a warrant!",
-                            "immediate_consequence": "Agents push into your home without showing a warrant.",
-                            "xp_value": 5
-                        },
-                        {
-                            "choice_text": "Ask 'Who is it?' through the closed door",
-                            "next_node_id": "ice_identify",
-                            "is_optimal": True,
-                            "feedback": "✅ Good! Always identify who is at your door before opening it.",
-                            "immediate_consequence": "The agents identify themselves as ICE officers.",
-                            "xp_value": 15
-                        },
-                        {
-                            "choice_text": "Stay silent and hope they go away",
-                            "next_node_id": "ice_silent",
-                            "is_optimal": False,
-                            "feedback": "⚠️ While you have rights, it's better to assert them clearly.",
-                            "immediate_consequence": "The knocking continues and gets more persistent.",
-                            "xp_value": 10
-                        }
-                    ]
-                },
-                {
-                    "id": "ice_identify",
-                    "title": "ICE at Your Door",
-                    "description": "The agents say they're ICE officers and want to come in to ask questions. They don't mention having a warrant. What's your response?",
-                    "choices": [
-                        {
-                            "choice_text": "Ask to see a warrant signed by a judge",
-                            "next_node_id": "ice_warrant_request",
-                            "is_optimal": True,
-                            "feedback": "✅ Perfect! ICE needs a judicial warrant to enter your home without consent.",
-                            "immediate_consequence": "You assert your 4th Amendment rights properly.",
-                            "xp_value": 25
-                        },
-                        {
-                            "choice_text": "Let them in to cooperate",
-                            "next_node_id": "ice_cooperate",
-                            "is_optimal": False,
-                            "feedback": "❌ You just consented to a search! Never let them in without a warrant.",
-                            "immediate_consequence": "ICE enters your home and begins questioning everyone present.",
-                            "xp_value": 5
-                        }
-                    ]
-                },
-                {
-                    "id": "ice_warrant_request",
-                    "title": "No Warrant Shown",
-                    "description": "The agents cannot produce a judicial warrant. They insist they need to speak with someone inside. How do you respond?",
-                    "choices": [
-                        {
-                            "choice_text": "State clearly: 'I do not consent to your entry. I am exercising my right to remain silent.'",
-                            "next_node_id": "ice_rights_asserted",
-                            "is_optimal": True,
-                            "feedback": "✅ Excellent! You're asserting your constitutional rights clearly and respectfully.",
-                            "immediate_consequence": "You've properly invoked your 4th and 5th Amendment rights.",
-                            "xp_value": 30
-                        },
-                        {
-                            "choice_text": "Argue with them about immigration law",
-                            "next_node_id": "ice_argue",
-                            "is_optimal": False,
-                            "feedback": "❌ Don't engage in arguments. Simply assert your rights and remain silent.",
-                            "immediate_consequence": "The conversation becomes heated and complicated.",
-                            "xp_value": 10
-                        }
-                    ]
-                },
-                {
-                    "id": "ice_rights_asserted",
-                    "title": "Rights Successfully Asserted",
-                    "description": "Without a warrant, the agents cannot legally enter your home. They eventually leave, unable to violate your constitutional rights.",
-                    "is_end_node": True,
-                    "legal_explanation": "You successfully protected your constitutional rights! Key points: 1) ICE needs a judicial warrant (not an administrative warrant) to enter your home, 2) You have the right to remain silent regardless of immigration status, 3) You have the right to refuse entry without a warrant, 4) Constitutional rights apply to everyone on US soil. Always remember: stay calm, assert your rights clearly, and contact an attorney if needed.",
-                    "outcome_type": "positive",
-                    "xp_reward": 40
-                }
-            ]
-        },
-        
-        # Housing Dispute Simulation
-        {
-            "title": "Landlord Dispute: Tenant Rights",
-            "description": "Your landlord is trying to evict you without proper notice. Learn your rights as a tenant and how to protect yourself from illegal eviction practices.",
-            "category": "housing_dispute",
-            "difficulty_level": 2,
-            "estimated_duration": 6,
-            "learning_objectives": [
-                "Understand proper eviction procedures",
-                "Learn about tenant rights and protections",
-                "Know when to seek legal help",
-                "Understand documentation requirements"
-            ],
-            "legal_context": "Tenant-landlord law varies by state but generally requires proper notice, just cause, and court orders for evictions.",
-            "applicable_laws": ["State Tenant-Landlord Laws", "Fair Housing Act", "Local Housing Codes"],
-            "start_node_id": "housing_start",
-            "scenario_nodes": [
-                {
-                    "id": "housing_start",
-                    "title": "Surprise Eviction Notice",
-                    "description": "You come home to find a handwritten note on your door from your landlord saying 'You have 3 days to get out or I'm changing the locks.' What's your first step?",
-                    "choices": [
-                        {
-                            "choice_text": "Pack up and leave immediately to avoid conflict",
-                            "next_node_id": "housing_leave",
-                            "is_optimal": False,
-                            "feedback": "❌ Don't let illegal tactics scare you! You have rights that protect you from improper eviction.",
-                            "immediate_consequence": "You lose your home and rights unnecessarily.",
-                            "xp_value": 5
-                        },
-                        {
-                            "choice_text": "Document the notice and research tenant rights",
-                            "next_node_id": "housing_document",
-                            "is_optimal": True,
-                            "feedback": "✅ Smart! Documentation is crucial and knowing your rights is the first step.",
-                            "immediate_consequence": "You have evidence and start building your case.",
-                            "xp_value": 20
-                        },
-                        {
-                            "choice_text": "Confront the landlord angrily",
-                            "next_node_id": "housing_confront",
-                            "is_optimal": False,
-                            "feedback": "⚠️ Emotions are understandable, but stay calm and focus on legal remedies.",
-                            "immediate_consequence": "The situation escalates and becomes more hostile.",
-                            "xp_value": 8
-                        }
-                    ]
-                },
-                {
-                    "id": "housing_document",
-                    "title": "Research Phase",
-                    "description": "You discover that your state requires 30 days written notice for eviction and landlords cannot change locks without a court order. Your landlord's notice is clearly illegal. What's next?",
-                    "choices": [
-                        {
-                            "choice_text": "Contact a tenant rights organization or legal aid",
-                            "next_node_id": "housing_legal_help",
-                            "is_optimal": True,
-                            "feedback": "✅ Excellent! Getting legal help early can prevent bigger problems.",
-                            "immediate_consequence": "You connect with advocates who know tenant law.",
-                            "xp_value": 25
-                        },
-                        {
-                            "choice_text": "Send a certified letter to your landlord explaining their violation",
-                            "next_node_id": "housing_letter",
-                            "is_optimal": True,
-                            "feedback": "✅ Good approach! Documenting your knowledge of the law can deter illegal actions.",
-                            "immediate_consequence": "You create a paper trail and assert your rights formally.",
-                            "xp_value": 20
-                        }
-                    ]
-                },
-                {
-                    "id": "housing_legal_help",
-                    "title": "Legal Support Secured",
-                    "description": "The tenant rights attorney confirms your landlord's actions are illegal and helps you file a complaint. Your housing is protected and you may be entitled to damages.",
-                    "is_end_node": True,
-                    "legal_explanation": "You successfully protected your tenant rights! Key lessons: 1) Landlords must follow proper legal procedures for evictions, 2) Tenants have the right to proper notice (usually 30+ days), 3) Only courts can order evictions, not landlords, 4) Illegal eviction attempts can result in damages for tenants, 5) Documentation is crucial for protecting your rights. Always know your local tenant laws and don't hesitate to seek legal help.",
-                    "outcome_type": "positive",
-                    "xp_reward": 35
-                }
-            ]
-        }
-    ]
+    from seed_documents import load_seed_documents  # imported only when seeding is needed
     
-    # Create simulation scenarios
-    created_scenarios = []
-    for scenario_data in simulation_scenarios:
-        # Convert scenario nodes
-        scenario_nodes = []
-        for node_data in scenario_data["scenario_nodes"]:
-            node = SimulationNode(**node_data)
-            scenario_nodes.append(node)
-        
-        # Create scenario
-        scenario = SimulationScenario(
-            **{k: v for k, v in scenario_data.items() if k != "scenario_nodes"},
-            scenario_nodes=scenario_nodes,
-            created_by="system"
-        )
-        created_scenarios.append(scenario)
+    # Create simulation scenarios, streamed from a generator into batched upserts
+    scenario_count = await upsert_seed_documents("simulation_scenarios", load_seed_documents("simulation_scenarios"), ("title", "created_by"))
+    invalidate_recommendation_catalog("simulation_scenarios")
+    await mark_collection_seeded("simulation_scenarios")
     
-    logging.info(f"Initialized {len(created_scenarios)} legal simulation scenarios")
+    logger.info("Initialized %d legal simulation scenarios", scenario_count)
 
 # Helper functions for Advanced Learning Paths
-def calculate_path_relevance(path: LearningPath, user_prefs: Dict[str, Any]) -> float:
-    """Calculate relevance score for a learning path based on user preferences"""
-    score = 0.0
-    
-    # Primary interests match
-    if path.path_type.value in [interest.value if hasattr(interest, 'value') else interest for interest in user_prefs.get('primary_interests', [])]:
-        score += 0.4
-    
-    # User situation match
-    user_situations = user_prefs.get('user_situation', [])
-    if any(situation in path.tags for situation in user_situations):
-        score += 0.3
-    
-    # Difficulty preference
-    preferred_difficulty = user_prefs.get('preferred_difficulty', 2)
-    difficulty_diff = abs(path.difficulty_level - preferred_difficulty)
-    score += 0.2 * (1 - difficulty_diff / 4)  # Normalize to 0-1
-    
-    # Learning style preference (simplified)
-    learning_style = user_prefs.get('learning_style', 'balanced')
-    if learning_style == 'interactive' and 'simulation' in path.tags:
-        score += 0.1
-    elif learning_style == 'visual' and 'visual' in path.tags:
-        score += 0.1
-    
-    return min(1.0, max(0.0, score))
-
-def get_personalization_reason(path: LearningPath, user_prefs: Dict[str, Any]) -> str:
-    """Generate explanation for why this path is recommended"""
+_INTEREST_LABELS = {
+    'tenant_protection': 'tenant rights',
+    'immigration_rights': 'immigration law',
+    'student_rights': 'student protections',
+    'criminal_defense': 'criminal law',
+    'employment_rights': 'workplace rights',
+    'consumer_protection': 'consumer law',
+    'protest_rights': 'protest law',
+    'family_law': 'family law',
+    'general_legal_literacy': 'general legal knowledge'
+}
+
+def get_personalization_reason(path: Dict[str, Any], context: Dict[str, Any]) -> str:
+    """Generate explanation for why this learning path document is recommended, from a path_preference_context"""
     reasons = []
     
-    # Check primary interests
-    primary_interests = user_prefs.get('primary_interests', [])
-    for interest in primary_interests:
-        interest_value = interest.value if hasattr(interest, 'value') else interest
-        if path.path_type.value == interest_value:
-            interest_labels = {
-                'tenant_protection': 'tenant rights',
-                'immigration_rights': 'immigration law',
-                'student_rights': 'student protections',
-                'criminal_defense': 'criminal law',
-                'employment_rights': 'workplace rights',
-                'consumer_protection': 'consumer law',
-                'protest_rights': 'protest law',
-                'family_law': 'family law',
-                'general_legal_literacy': 'general legal knowledge'
-            }
-            reasons.append(f"Matches your interest in {interest_labels.get(interest_value, interest_value)}")
+    # Check primary interests (a path has one type, so at most one can match)
+    path_type = path["path_type"]
+    path_type = path_type.value if hasattr(path_type, 'value') else path_type
+    if path_type in context["interests"]:
+        reasons.append(f"Matches your interest in {_INTEREST_LABELS.get(path_type, path_type)}")
     
     # Check user situation
-    user_situations = user_prefs.get('user_situation', [])
-    matching_situations = [situation for situation in user_situations if situation in path.tags]
+    path_tags = frozenset(path.get("tags", []))
+    matching_situations = [situation for situation in context["situations"] if situation in path_tags]
     if matching_situations:
         reasons.append(f"Relevant to your situation as a {', '.join(matching_situations)}")
     
     # Check difficulty
-    preferred_difficulty = user_prefs.get('preferred_difficulty', 2)
-    if abs(path.difficulty_level - preferred_difficulty) <= 1:
+    if abs(path.get("difficulty_level", 1) - context["preferred_difficulty"]) <= 1:
         reasons.append(f"Matches your preferred difficulty level")
     
     return ' • '.join(reasons) if reasons else "Recommended based on your profile"
@@ -6217,41 +5794,46 @@ async def check_prerequisites_met(user_id: str, prerequisite_path_ids: List[str]
     if not prerequisite_path_ids:
         return True
     
-    completed_paths = await db.user_learning_progress.find({
+    completed_count = await db.user_learning_progress.count_documents({
         "user_id": user_id,
         "learning_path_id": {"$in": prerequisite_path_ids},
         "is_completed": True
-    }).to_list(len(prerequisite_path_ids))
+    })
     
-    return len(completed_paths) == len(prerequisite_path_ids)
+    return completed_count == len(prerequisite_path_ids)
 
-async def get_node_with_unlock_status(node_id: str, learning_path: LearningPath, user_id: str) -> Dict[str, Any]:
-    """Get a learning node with its unlock status"""
-    node = next((n for n in learning_path.path_nodes if n.id == node_id), None)
-    if not node:
-        return {}
+async def get_all_nodes_with_unlock_status(learning_path: LearningPath, user_id: str) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Get the user's progress on a path and every node with its unlock status, in one round of queries"""
+    user_progress, user = await asyncio.gather(
+        db.user_learning_progress.find_one({
+            "user_id": user_id,
+            "learning_path_id": learning_path.id
+        }),
+        db.users.find_one({"id": user_id}, {"_id": 0, "xp": 1})
+    )
+    user_xp = user.get("xp", 0) if user else 0
     
-    user_progress = await db.user_learning_progress.find_one({
-        "user_id": user_id,
-        "learning_path_id": learning_path.id
-    })
+    return user_progress, nodes_with_unlock_status(learning_path, user_progress, user_xp)
+
+def nodes_with_unlock_status(learning_path: LearningPath, user_progress: Optional[Dict[str, Any]], user_xp: int) -> List[Dict[str, Any]]:
+    """Every node of a path with its unlock status, from progress and XP the caller already has"""
+    completed_nodes = set(user_progress.get("completed_nodes", [])) if user_progress else set()
     
-    node_dict = node.dict()
-    node_dict["is_unlocked"] = await is_node_unlocked(node, user_progress, user_id)
-    node_dict["is_completed"] = node.id in (user_progress.get("completed_nodes", []) if user_progress else [])
+    enriched_nodes = []
+    for node in learning_path.path_nodes:
+        node_dict = node.dict()
+        node_dict["is_unlocked"] = _is_node_unlocked(node, user_progress, user_xp)
+        node_dict["is_completed"] = node.id in completed_nodes
+        enriched_nodes.append(node_dict)
     
-    return node_dict
+    return enriched_nodes
 
-async def is_node_unlocked(node: LearningPathNode, user_progress: Optional[Dict[str, Any]], user_id: str) -> bool:
-    """Check if a learning node is unlocked for the user"""
+def _is_node_unlocked(node: LearningPathNode, user_progress: Optional[Dict[str, Any]], user_xp: int) -> bool:
+    """Check if a learning node is unlocked for a user with the given progress and XP"""
     if not user_progress:
         # Only start node is unlocked without progress
         return node.xp_required == 0
     
-    # Get user's current XP
-    user = await db.users.find_one({"id": user_id})
-    user_xp = user.get("xp", 0) if user else 0
-    
     # Check XP requirement
     if node.xp_required > user_xp:
         return False
@@ -6273,12 +5855,62 @@ async def validate_completion_criteria(criteria: Dict[str, Any], completion_data
     
     return True
 
+# The recommendable catalog only changes when content is seeded or created, so the active
+# documents are cached process-wide as plain dicts, projected to the fields the recommenders read
+RECOMMENDATION_CATALOGS = {
+    "learning_paths": [
+        {"$match": {"is_active": True}},
+        {"$project": {"_id": 0, "id": 1, "title": 1, "description": 1, "path_type": 1, "tags": 1,
+                      "difficulty_level": 1, "estimated_duration": 1, "total_xp_reward": 1}}
+    ],
+    "legal_myths": [
+        {"$match": {"status": "published"}},
+        {"$sort": {"published_at": -1}},
+        # Only the first 100 characters of a statement are ever shown
+        {"$project": {"_id": 0, "id": 1, "title": 1, "category": 1,
+                      "myth_statement": {"$substrCP": ["$myth_statement", 0, 100]}}}
+    ],
+    "simulation_scenarios": [
+        {"$match": {"is_active": True}},
+        {"$project": {"_id": 0, "id": 1, "title": 1, "description": 1, "category": 1, "estimated_duration": 1}}
+    ],
+}
+recommendation_catalog_cache = TTLCache(maxsize=len(RECOMMENDATION_CATALOGS), ttl=60)
+
+async def get_recommendation_catalog(collection: str) -> List[Dict[str, Any]]:
+    """Active documents of a recommendable collection, cached for a minute"""
+    catalog = recommendation_catalog_cache.get(collection)
+    if catalog is None:
+        catalog = await db[collection].aggregate(RECOMMENDATION_CATALOGS[collection]).to_list(None)
+        recommendation_catalog_cache[collection] = catalog
+    return catalog
+
+def invalidate_recommendation_catalog(collection: str):
+    """Drop a cached catalog after its collection is written to"""
+    recommendation_catalog_cache.pop(collection, None)
+    general_recommendations_cache.clear()
+
+# General recommendations are the same for every user, so whole responses are cached per limit
+general_recommendations_cache = TTLCache(maxsize=64, ttl=60)
+
+async def get_general_recommendations_response(limit: int) -> APIResponse:
+    """General recommendations wrapped in an APIResponse"""
+    response = general_recommendations_cache.get(limit)
+    if response is None:
+        response = APIResponse(
+            success=True,
+            message="General recommendations retrieved successfully",
+            data=await get_general_recommendations(limit)
+        )
+        general_recommendations_cache[limit] = response
+    return response
+
 async def get_general_recommendations(limit: int) -> List[Dict[str, Any]]:
     """Get general recommendations for users without personalization"""
     recommendations = []
     
     # Recommend popular learning paths
-    paths = await db.learning_paths.find({"is_active": True}).limit(limit // 2).to_list(limit // 2)
+    paths = (await get_recommendation_catalog("learning_paths"))[:limit // 2]
     for path in paths:
         recommendations.append({
             "content_type": "learning_path",
@@ -6292,7 +5924,7 @@ async def get_general_recommendations(limit: int) -> List[Dict[str, Any]]:
         })
     
     # Recommend recent myths
-    myths = await db.legal_myths.find({"status": "published"}).sort("published_at", -1).limit(limit // 2).to_list(limit // 2)
+    myths = (await get_recommendation_catalog("legal_myths"))[:limit // 2]
     for myth in myths:
         recommendations.append({
             "content_type": "myth",
@@ -6310,35 +5942,55 @@ async def get_general_recommendations(limit: int) -> List[Dict[str, Any]]:
 async def recommend_learning_paths(user_prefs: Dict[str, Any], user_id: str, limit: int) -> List[Dict[str, Any]]:
     """Recommend learning paths based on user preferences"""
     recommendations = []
-    
-    # Get all active learning paths
-    paths = await db.learning_paths.find({"is_active": True}).to_list(100)
-    
-    # Calculate relevance scores
-    scored_paths = []
-    for path in paths:
-        path_obj = LearningPath(**path)
-        relevance = calculate_path_relevance(path_obj, user_prefs)
-        if relevance > 0.3:  # Only recommend paths with decent relevance
-            scored_paths.append((path_obj, relevance))
-    
-    # Sort by relevance and take top recommendations
-    scored_paths.sort(key=lambda x: x[1], reverse=True)
-    
-    for path_obj, score in scored_paths[:limit]:
+    paths = await get_recommendation_catalog("learning_paths")
+    if not paths or limit <= 0:
+        return recommendations
+    
+    # Score the cached active paths, keeping only those with decent relevance
+    preference_context = path_preference_context(user_prefs)
+    scores = score_learning_paths(paths, preference_context)
+    candidates = np.flatnonzero(scores > 0.3)
+    
+    # Take the top recommendations, sorted by relevance
+    if len(candidates) > limit:
+        candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+    top_paths = candidates[np.argsort(-scores[candidates], kind="stable")]
+    
+    for index in top_paths:
+        path = paths[index]
+        score = float(scores[index])
         recommendations.append({
             "content_type": "learning_path",
-            "content_id": path_obj.id,
-            "title": path_obj.title,
-            "description": path_obj.description,
+            "content_id": path["id"],
+            "title": path["title"],
+            "description": path["description"],
             "confidence_score": score,
-            "reason": get_personalization_reason(path_obj, user_prefs),
-            "estimated_time": path_obj.estimated_duration,
-            "xp_potential": path_obj.total_xp_reward
+            "reason": get_personalization_reason(path, preference_context),
+            "estimated_time": path["estimated_duration"],
+            "xp_potential": path.get("total_xp_reward", 0)
         })
     
     return recommendations
 
+# Interest -> content category maps used by the recommenders
+_INTEREST_TO_MYTH_CATEGORY = {
+    'tenant_protection': 'housing',
+    'immigration_rights': 'civil_rights',
+    'student_rights': 'education',
+    'criminal_defense': 'criminal_law',
+    'employment_rights': 'employment',
+    'consumer_protection': 'consumer_protection',
+    'protest_rights': 'civil_rights',
+    'family_law': 'family_law'
+}
+
+_INTEREST_TO_SIM_CATEGORY = {
+    'tenant_protection': 'housing_dispute',
+    'immigration_rights': 'police_encounter',
+    'criminal_defense': 'traffic_stop',
+    'student_rights': 'police_encounter'
+}
+
 async def recommend_myths(user_prefs: Dict[str, Any], user_id: str, limit: int) -> List[Dict[str, Any]]:
     """Recommend myths based on user preferences"""
     recommendations = []
@@ -6347,29 +5999,16 @@ async def recommend_myths(user_prefs: Dict[str, Any], user_id: str, limit: int)
     primary_interests = user_prefs.get('primary_interests', [])
     
     # Convert interests to categories
-    interest_to_category = {
-        'tenant_protection': 'housing',
-        'immigration_rights': 'civil_rights',
-        'student_rights': 'education',
-        'criminal_defense': 'criminal_law',
-        'employment_rights': 'employment',
-        'consumer_protection': 'consumer_protection',
-        'protest_rights': 'civil_rights',
-        'family_law': 'family_law'
+    relevant_categories = {
+        _INTEREST_TO_MYTH_CATEGORY[interest_str] for interest_str in interest_values(primary_interests)
+        if interest_str in _INTEREST_TO_MYTH_CATEGORY
     }
     
-    relevant_categories = []
-    for interest in primary_interests:
-        interest_str = interest.value if hasattr(interest, 'value') else str(interest)
-        if interest_str in interest_to_category:
-            relevant_categories.append(interest_to_category[interest_str])
-    
     # Get myths from relevant categories
-    query = {"status": "published"}
+    myths = await get_recommendation_catalog("legal_myths")
     if relevant_categories:
-        query["category"] = {"$in": relevant_categories}
-    
-    myths = await db.legal_myths.find(query).limit(limit).to_list(limit)
+        myths = [myth for myth in myths if myth["category"] in relevant_categories]
+    myths = myths[:limit]
     
     for myth in myths:
         confidence = 0.8 if myth["category"] in relevant_categories else 0.5
@@ -6395,21 +6034,17 @@ async def recommend_simulations(user_prefs: Dict[str, Any], user_id: str, limit:
     primary_interests = user_prefs.get('primary_interests', [])
     
     # Map interests to simulation categories
-    interest_to_sim_category = {
-        'tenant_protection': 'housing_dispute',
-        'immigration_rights': 'police_encounter',
-        'criminal_defense': 'traffic_stop',
-        'student_rights': 'police_encounter'
+    relevant_sim_categories = {
+        _INTEREST_TO_SIM_CATEGORY[interest_str] for interest_str in interest_values(primary_interests)
+        if interest_str in _INTEREST_TO_SIM_CATEGORY
     }
     
-    relevant_sim_categories = []
-    for interest in primary_interests:
-        interest_str = interest.value if hasattr(interest, 'value') else str(interest)
-        if interest_str in interest_to_sim_category:
-            relevant_sim_categories.append(interest_to_sim_category[interest_str])
-    
-    # Get simulations
-    simulations = await db.simulation_scenarios.find({"is_active": True}).limit(limit).to_list(limit)
+    # Get simulations, those in relevant categories first
+    simulations = heapq.nlargest(
+        limit,
+        await get_recommendation_catalog("simulation_scenarios"),
+        key=lambda sim: sim["category"] in relevant_sim_categories
+    )
     
     for sim in simulations:
         confidence = 0.7 if sim["category"] in relevant_sim_categories else 0.4
@@ -6429,518 +6064,72 @@ async def recommend_simulations(user_prefs: Dict[str, Any], user_id: str, limit:
 async def initialize_learning_paths():
     """Initialize the database with comprehensive learning paths"""
     # Check if learning paths already exist
-    existing_count = await db.learning_paths.count_documents({})
-    if existing_count > 0:
+    if await is_collection_seeded("learning_paths"):
         return  # Learning paths already initialized
     
-    learning_paths_data = [
-        {
-            "title": "Tenant Rights Mastery",
-            "description": "Master your rights as a renter. Learn about lease agreements, security deposits, eviction procedures, and how to deal with problem landlords.",
-            "path_type": LearningPathType.TENANT_PROTECTION,
-            "target_audience": ["undergraduate", "graduate", "general"],
-            "estimated_duration": 45,  # minutes
-            "difficulty_level": 2,
-            "learning_objectives": [
-                "Understand lease agreement essentials",
-                "Know your rights regarding security deposits",
-                "Recognize illegal eviction practices",
-                "Learn how to document housing issues"
-            ],
-            "tags": ["renter", "housing", "landlord", "lease", "eviction"],
-            "total_xp_reward": 150,
-            "start_node_id": "tenant_intro",
-            "path_nodes": [
-                {
-                    "id": "tenant_intro",
-                    "title": "Welcome to Tenant Rights",
-                    "description": "Learn the basics of tenant-landlord relationships and your fundamental rights as a renter.",
-                    "node_type": "myth",
-                    "content_id": None,  # Reference to housing myth
-                    "xp_required": 0,
-                    "xp_reward": 20,
-                    "prerequisites": [],
-                    "estimated_minutes": 5,
-                    "difficulty_level": 1,
-                    "is_locked": False,
-                    "completion_criteria": {"required_interaction": "read_and_understand"}
-                },
-                {
-                    "id": "tenant_simulation",
-                    "title": "Housing Dispute Practice",
-                    "description": "Practice handling a landlord dispute in a safe simulation environment.",
-                    "node_type": "simulation",
-                    "content_id": None,  # Reference to housing simulation
-                    "xp_required": 50,
-                    "xp_reward": 40,
-                    "prerequisites": ["tenant_intro"],
-                    "estimated_minutes": 15,
-                    "difficulty_level": 2,
-                    "is_locked": True,
-                    "completion_criteria": {"simulation_score": 70}
-                },
-                {
-                    "id": "tenant_qa",
-                    "title": "Housing Q&A Discussion",
-                    "description": "Engage with the community on housing-related questions and learn from others' experiences.",
-                    "node_type": "qa_topic",
-                    "content_id": "housing",
-                    "xp_required": 100,
-                    "xp_reward": 30,
-                    "prerequisites": ["tenant_simulation"],
-                    "estimated_minutes": 10,
-                    "difficulty_level": 2,
-                    "is_locked": True,
-                    "completion_criteria": {"ask_or_answer": True}
-                },
-                {
-                    "id": "tenant_ai_session",
-                    "title": "AI Housing Consultation",
-                    "description": "Have a focused conversation with the AI assistant about specific housing scenarios.",
-                    "node_type": "ai_session",
-                    "content_id": None,
-                    "xp_required": 150,
-                    "xp_reward": 35,
-                    "prerequisites": ["tenant_qa"],
-                    "estimated_minutes": 15,
-                    "difficulty_level": 3,
-                    "is_locked": True,
-                    "completion_criteria": {"ai_interactions": 3}
-                }
-            ]
-        },
-        {
-            "title": "Immigration Rights Protection",
-            "description": "Essential knowledge for protecting your rights regardless of immigration status. Learn about ICE encounters, workplace protections, and community resources.",
-            "path_type": LearningPathType.IMMIGRATION_RIGHTS,
-            "target_audience": ["undergraduate", "graduate", "general"],
-            "estimated_duration": 50,
-            "difficulty_level": 3,
-            "learning_objectives": [
-                "Understand constitutional rights for all persons",
-                "Learn proper responses to ICE encounters",
-                "Know workplace immigration protections",
-                "Identify community legal resources"
-            ],
-            "tags": ["immigrant", "ice", "workplace", "constitutional"],
-            "total_xp_reward": 180,
-            "start_node_id": "immigration_basics",
-            "path_nodes": [
-                {
-                    "id": "immigration_basics",
-                    "title": "Constitutional Rights for Everyone",
-                    "description": "Learn about the constitutional rights that apply to all people in the United States, regardless of immigration status.",
-                    "node_type": "myth",
-                    "content_id": None,
-                    "xp_required": 0,
-                    "xp_reward": 25,
-                    "prerequisites": [],
-                    "estimated_minutes": 7,
-                    "difficulty_level": 2,
-                    "is_locked": False,
-                    "completion_criteria": {"required_interaction": "read_and_understand"}
-                },
-                {
-                    "id": "ice_simulation",
-                    "title": "ICE Encounter Response",
-                    "description": "Practice handling an ICE encounter scenario with proper rights assertion.",
-                    "node_type": "simulation",
-                    "content_id": None,
-                    "xp_required": 100,
-                    "xp_reward": 50,
-                    "prerequisites": ["immigration_basics"],
-                    "estimated_minutes": 20,
-                    "difficulty_level": 3,
-                    "is_locked": True,
-                    "completion_criteria": {"simulation_score": 75}
-                },
-                {
-                    "id": "immigration_community",
-                    "title": "Immigration Law Discussion",
-                    "description": "Participate in community discussions about immigration law and share knowledge.",
-                    "node_type": "qa_topic",
-                    "content_id": "civil_rights",
-                    "xp_required": 200,
-                    "xp_reward": 40,
-                    "prerequisites": ["ice_simulation"],
-                    "estimated_minutes": 15,
-                    "difficulty_level": 3,
-                    "is_locked": True,
-                    "completion_criteria": {"ask_or_answer": True}
-                },
-                {
-                    "id": "immigration_resources",
-                    "title": "Legal Resource Navigation",
-                    "description": "Learn how to find and access legal resources in your community.",
-                    "node_type": "ai_session",
-                    "content_id": None,
-                    "xp_required": 300,
-                    "xp_reward": 45,
-                    "prerequisites": ["immigration_community"],
-                    "estimated_minutes": 12,
-                    "difficulty_level": 3,
-                    "is_locked": True,
-                    "completion_criteria": {"ai_interactions": 2}
-                }
-            ]
-        },
-        {
-            "title": "Student Rights & Campus Law",
-            "description": "Navigate your rights as a student, from campus searches to free speech protections. Essential for college students.",
-            "path_type": LearningPathType.STUDENT_RIGHTS,
-            "target_audience": ["undergraduate", "graduate"],
-            "estimated_duration": 35,
-            "difficulty_level": 2,
-            "learning_objectives": [
-                "Understand student 4th Amendment protections",
-                "Learn about campus free speech rights",
-                "Know academic due process procedures",
-                "Recognize discrimination and harassment"
-            ],
-            "tags": ["student", "campus", "education", "free speech"],
-            "total_xp_reward": 120,
-            "start_node_id": "student_basics",
-            "path_nodes": [
-                {
-                    "id": "student_basics",
-                    "title": "Students Don't Lose All Rights",
-                    "description": "Understand that students retain constitutional protections even on campus, though with some limitations.",
-                    "node_type": "myth",
-                    "content_id": None,
-                    "xp_required": 0,
-                    "xp_reward": 20,
-                    "prerequisites": [],
-                    "estimated_minutes": 5,
-                    "difficulty_level": 1,
-                    "is_locked": False,
-                    "completion_criteria": {"required_interaction": "read_and_understand"}
-                },
-                {
-                    "id": "campus_scenarios",
-                    "title": "Campus Rights Practice",
-                    "description": "Practice asserting your rights in various campus scenarios.",
-                    "node_type": "qa_topic",
-                    "content_id": "education",
-                    "xp_required": 50,
-                    "xp_reward": 30,
-                    "prerequisites": ["student_basics"],
-                    "estimated_minutes": 12,
-                    "difficulty_level": 2,
-                    "is_locked": True,
-                    "completion_criteria": {"ask_or_answer": True}
-                },
-                {
-                    "id": "student_ai_consultation",
-                    "title": "Campus Legal Consultation",
-                    "description": "Discuss specific campus legal scenarios with the AI assistant.",
-                    "node_type": "ai_session",
-                    "content_id": None,
-                    "xp_required": 100,
-                    "xp_reward": 40,
-                    "prerequisites": ["campus_scenarios"],
-                    "estimated_minutes": 18,
-                    "difficulty_level": 2,
-                    "is_locked": True,
-                    "completion_criteria": {"ai_interactions": 3}
-                }
-            ]
-        },
-        {
-            "title": "Criminal Defense Fundamentals",
-            "description": "Essential knowledge for protecting yourself during police encounters, traffic stops, and criminal investigations.",
-            "path_type": LearningPathType.CRIMINAL_DEFENSE,
-            "target_audience": ["undergraduate", "graduate", "general"],
-            "estimated_duration": 40,
-            "difficulty_level": 2,
-            "learning_objectives": [
-                "Master Miranda rights and when they apply",
-                "Learn proper traffic stop procedures",
-                "Understand search and seizure protections",
-                "Know when to request an attorney"
-            ],
-            "tags": ["police", "traffic", "miranda", "attorney"],
-            "total_xp_reward": 140,
-            "start_node_id": "miranda_myth",
-            "path_nodes": [
-                {
-                    "id": "miranda_myth",
-                    "title": "Miranda Rights Reality Check",
-                    "description": "Learn the truth about when police must read Miranda rights - it's not always during arrests.",
-                    "node_type": "myth",
-                    "content_id": None,
-                    "xp_required": 0,
-                    "xp_reward": 25,
-                    "prerequisites": [],
-                    "estimated_minutes": 6,
-                    "difficulty_level": 2,
-                    "is_locked": False,
-                    "completion_criteria": {"required_interaction": "read_and_understand"}
-                },
-                {
-                    "id": "traffic_stop_practice",
-                    "title": "Traffic Stop Mastery",
-                    "description": "Practice handling a traffic stop scenario with confidence and knowledge of your rights.",
-                    "node_type": "simulation",
-                    "content_id": None,
-                    "xp_required": 75,
-                    "xp_reward": 45,
-                    "prerequisites": ["miranda_myth"],
-                    "estimated_minutes": 18,
-                    "difficulty_level": 2,
-                    "is_locked": True,
-                    "completion_criteria": {"simulation_score": 80}
-                },
-                {
-                    "id": "criminal_law_discussion",
-                    "title": "Criminal Law Community",
-                    "description": "Engage with others about criminal law questions and scenarios.",
-                    "node_type": "qa_topic",
-                    "content_id": "criminal_law",
-                    "xp_required": 150,
-                    "xp_reward": 35,
-                    "prerequisites": ["traffic_stop_practice"],
-                    "estimated_minutes": 10,
-                    "difficulty_level": 2,
-                    "is_locked": True,
-                    "completion_criteria": {"ask_or_answer": True}
-                },
-                {
-                    "id": "defense_strategies",
-                    "title": "Defense Strategy Session",
-                    "description": "Learn about legal defense strategies and when to seek professional help.",
-                    "node_type": "ai_session",
-                    "content_id": None,
-                    "xp_required": 200,
-                    "xp_reward": 35,
-                    "prerequisites": ["criminal_law_discussion"],
-                    "estimated_minutes": 6,
-                    "difficulty_level": 3,
-                    "is_locked": True,
-                    "completion_criteria": {"ai_interactions": 2}
-                }
-            ]
-        }
-    ]
+    from seed_documents import load_seed_documents  # imported only when seeding is needed
     
     # Create learning paths
-    created_paths = []
-    for path_data in learning_paths_data:
-        # Convert path nodes
-        path_nodes = []
-        for node_data in path_data["path_nodes"]:
-            node = LearningPathNode(**node_data)
-            path_nodes.append(node)
-        
-        # Create learning path
-        learning_path = LearningPath(
-            **{k: v for k, v in path_data.items() if k != "path_nodes"},
-            path_nodes=path_nodes,
-            created_by="system"
-        )
-        created_paths.append(learning_path)
+    path_count = await upsert_seed_documents("learning_paths", load_seed_documents("learning_paths"), ("title", "created_by"))
+    invalidate_recommendation_catalog("learning_paths")
+    await mark_collection_seeded("learning_paths")
     
-    await db.learning_paths.insert_many([path.dict() for path in created_paths])
+    logger.info("Initialized %d learning paths", path_count)
 
 async def initialize_regional_protections():
     """Initialize the database with regional protections for unlocking"""
     # Check if protections already exist
-    existing_count = await db.regional_protections.count_documents({})
-    if existing_count > 0:
+    if await is_collection_seeded("regional_protections"):
         return  # Protections already initialized
     
-    # Define regional protections data
-    regional_protections_data = [
-        {
-            "statute_code": "CA Civil Code §1942",
-            "statute_title": "Tenant Right to Repair",
-            "protection_description": "Right to withhold rent for necessary repairs when landlord fails to maintain habitability",
-            "state": "California",
-            "protection_type": ProtectionType.RENTER,
-            "unlock_requirements": {
-                "lessons_completed": 3,
-                "xp_required": 150
-            },
-            "is_federal": False
-        },
-        {
-            "statute_code": "CA Civil Code §1946.2",
-            "statute_title": "Security Deposit Protection",
-            "protection_description": "Protection against excessive security deposits and requirements for deposit return",
-            "state": "California",
-            "protection_type": ProtectionType.RENTER,
-            "unlock_requirements": {
-                "lessons_completed": 2,
-                "xp_required": 100
-            },
-            "is_federal": False
-        },
-        {
-            "statute_code": "1st Amendment",
-            "statute_title": "Peaceful Assembly Rights",
-            "protection_description": "Constitutional right to peaceful assembly and protest",
-            "state": "Federal",
-            "protection_type": ProtectionType.PROTESTER,
-            "unlock_requirements": {
-                "lessons_completed": 2,
-                "xp_required": 100
-            },
-            "is_federal": True
-        },
-        {
-            "statute_code": "4th Amendment",
-            "statute_title": "Constitutional Rights",
-            "protection_description": "Protection against unreasonable searches and seizures",
-            "state": "Federal",
-            "protection_type": ProtectionType.GENERAL,
-            "unlock_requirements": {
-                "lessons_completed": 5,
-                "xp_required": 300
-            },
-            "is_federal": True
-        },
-        {
-            "statute_code": "5th Amendment",
-            "statute_title": "Miranda Rights",
-            "protection_description": "Right to remain silent and right to an attorney",
-            "state": "Federal",
-            "protection_type": ProtectionType.GENERAL,
-            "unlock_requirements": {
-                "lessons_completed": 4,
-                "xp_required": 250
-            },
-            "is_federal": True
-        },
-        {
-            "statute_code": "14th Amendment",
-            "statute_title": "Equal Protection",
-            "protection_description": "Equal protection under the law regardless of race, gender, or national origin",
-            "state": "Federal",
-            "protection_type": ProtectionType.GENERAL,
-            "unlock_requirements": {
-                "lessons_completed": 6,
-                "xp_required": 400
-            },
-            "is_federal": True
-        },
-        {
-            "statute_code": "Title VII",
-            "statute_title": "Employment Discrimination Protection",
-            "protection_description": "Protection against workplace discrimination based on protected characteristics",
-            "state": "Federal",
-            "protection_type": ProtectionType.WORKER,
-            "unlock_requirements": {
-                "lessons_completed": 4,
-                "xp_required": 250
-            },
-            "is_federal": True
-        },
-        {
-            "statute_code": "Fair Labor Standards Act",
-            "statute_title": "Wage and Hour Protection",
-            "protection_description": "Protection for minimum wage, overtime pay, and working conditions",
-            "state": "Federal",
-            "protection_type": ProtectionType.WORKER,
-            "unlock_requirements": {
-                "lessons_completed": 3,
-                "xp_required": 200
-            },
-            "is_federal": True
-        },
-        {
-            "statute_code": "Title IX",
-            "statute_title": "Education Discrimination Protection",
-            "protection_description": "Protection against sex-based discrimination in education",
-            "state": "Federal",
-            "protection_type": ProtectionType.STUDENT,
-            "unlock_requirements": {
-                "lessons_completed": 3,
-                "xp_required": 180
-            },
-            "is_federal": True
-        },
-        {
-            "statute_code": "FERPA",
-            "statute_title": "Student Privacy Rights",
-            "protection_description": "Protection of student education records and privacy rights",
-            "state": "Federal",
-            "protection_type": ProtectionType.STUDENT,
-            "unlock_requirements": {
-                "lessons_completed": 2,
-                "xp_required": 120
-            },
-            "is_federal": True
-        },
-        {
-            "statute_code": "ADA",
-            "statute_title": "Disability Rights Protection",
-            "protection_description": "Protection against discrimination based on disability",
-            "state": "Federal",
-            "protection_type": ProtectionType.DISABLED,
-            "unlock_requirements": {
-                "lessons_completed": 4,
-                "xp_required": 280
-            },
-            "is_federal": True
-        },
-        {
-            "statute_code": "Immigration and Nationality Act",
-            "statute_title": "Immigration Rights Protection",
-            "protection_description": "Basic rights for immigrants regardless of status",
-            "state": "Federal",
-            "protection_type": ProtectionType.UNDOCUMENTED,
-            "unlock_requirements": {
-                "lessons_completed": 5,
-                "xp_required": 350
-            },
-            "is_federal": True
-        },
-        {
-            "statute_code": "NY Education Law §3214",
-            "statute_title": "Student Due Process Rights",
-            "protection_description": "Due process rights for students facing suspension or expulsion",
-            "state": "New York",
-            "protection_type": ProtectionType.STUDENT,
-            "unlock_requirements": {
-                "lessons_completed": 3,
-                "xp_required": 200
-            },
-            "is_federal": False
-        },
-        {
-            "statute_code": "TX Property Code §92.006",
-            "statute_title": "Landlord Entry Rights",
-            "protection_description": "Protection against unlawful entry by landlord",
-            "state": "Texas",
-            "protection_type": ProtectionType.RENTER,
-            "unlock_requirements": {
-                "lessons_completed": 2,
-                "xp_required": 150
-            },
-            "is_federal": False
-        },
-        {
-            "statute_code": "FL Statute §83.56",
-            "statute_title": "Termination of Tenancy",
-            "protection_description": "Protection against unlawful eviction and termination procedures",
-            "state": "Florida",
-            "protection_type": ProtectionType.RENTER,
-            "unlock_requirements": {
-                "lessons_completed": 4,
-                "xp_required": 220
-            },
-            "is_federal": False
-        }
-    ]
+    from seed_documents import load_seed_documents  # imported only when seeding is needed
     
     # Create regional protections
-    created_protections = []
-    for protection_data in regional_protections_data:
-        protection = RegionalProtection(**protection_data)
-        created_protections.append(protection)
-    
-    await db.regional_protections.insert_many([protection.dict() for protection in created_protections])
-    logging.info(f"Initialized {len(created_protections)} regional protections")
+    # Upserts keyed on the unique statute code, so workers seeding at once cannot duplicate protections
+    protection_count = await upsert_seed_documents("regional_protections", load_seed_documents("regional_protections"), ("statute_code",))
+    await mark_collection_seeded("regional_protections")
+    logger.info("Initialized %d regional protections", protection_count)
+
+background_writer_task = None
+seed_task = None
+
+async def seed_database() -> List[str]:
+    """Run the seed initializers, then release routes waiting on seed data; returns the names of any that failed"""
+    # The seeded collections are independent, so their initializers run concurrently;
+    # one failing initializer is logged without stopping the others
+    initializers = (
+        initialize_script_templates,
+        initialize_legal_myths,
+        initialize_legal_simulations,
+        initialize_learning_paths,
+        initialize_regional_protections,
+    )
+    failed = []
+    try:
+        results = await asyncio.gather(*(initializer() for initializer in initializers), return_exceptions=True)
+        for initializer, result in zip(initializers, results):
+            if isinstance(result, Exception):
+                logger.error("Startup initializer %s failed", initializer.__name__, exc_info=result)
+                failed.append(initializer.__name__)
+    finally:
+        seed_ready.set()
+    return failed
+
+async def startup_db_client():
+    """Create indexes and start the background writer; with SEED_ON_STARTUP, seeding runs in the background so traffic is served immediately"""
+    global background_writer_task, seed_task
+    # Open the minimum pool's connections (server discovery and handshakes) before the first request needs them
+    await asyncio.gather(*(client.admin.command("ping") for _ in range(MONGO_MIN_POOL_SIZE)))
+    await ensure_indexes()
+    background_writer_task = asyncio.create_task(drain_background_writes())
+    if SEED_ON_STARTUP:
+        seed_task = spawn_background_task(seed_database())
+    else:
+        seed_ready.set()  # seeded ahead of time by seed.py
 
-@app.on_event("shutdown")
 async def shutdown_db_client():
+    if seed_task:
+        seed_task.cancel()
+    await stop_background_writes(background_writer_task)
     client.close()
+    log_listener.stop()
@@ -0,0 +1,75 @@
+"""
+Tests for the vectorized learning path scoring
+"""
+
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from learning_path_scoring import (  # noqa: E402
+    build_learning_path_score_arrays,
+    get_learning_path_score_arrays,
+    path_preference_context,
+    score_learning_paths,
+    score_path_arrays,
+)
+
+PATHS = [
+    {"id": "tenant", "path_type": "tenant_protection", "difficulty_level": 1, "tags": ["renting", "eviction"]},
+    {"id": "stops", "path_type": "criminal_defense", "difficulty_level": 3, "tags": ["traffic_stop", "simulation"]},
+    {"id": "campus", "path_type": "student_rights", "difficulty_level": 2, "tags": ["student", "visual"]},
+    {"id": "work", "path_type": "employment_rights", "difficulty_level": 4, "tags": []},
+    {"id": "visa", "path_type": "immigration_rights", "difficulty_level": 5, "tags": ["renting", "simulation"]},
+]
+
+USER_PREFS = {
+    "primary_interests": ["tenant_protection", "criminal_defense"],
+    "user_situation": ["renting", "student"],
+    "preferred_difficulty": 2,
+    "learning_style": "interactive",
+}
+
+def reference_path_relevance(path, context):
+    """The per-path formula the listing used before it was vectorized"""
+    path_tags = frozenset(path.get("tags", []))
+    score = 0.0
+    if path["path_type"] in context["interests"]:
+        score += 0.4
+    if not path_tags.isdisjoint(context["situation_set"]):
+        score += 0.3
+    difficulty_diff = abs(path.get("difficulty_level", 1) - context["preferred_difficulty"])
+    score += 0.2 * (1 - difficulty_diff / 4)
+    if context["style_tag"] in path_tags:
+        score += 0.1
+    return min(1.0, max(0.0, score))
+
+def test_score_path_arrays_matches_per_path_formula():
+    context = path_preference_context(USER_PREFS)
+    scores = score_path_arrays(build_learning_path_score_arrays(PATHS), context)
+
+    expected = [reference_path_relevance(path, context) for path in PATHS]
+    assert scores.tolist() == pytest.approx(expected)
+
+    ranked_ids = [PATHS[index]["id"] for index in (-scores).argsort(kind="stable")]
+    expected_ids = [path["id"] for _, path in sorted(zip(expected, PATHS), key=lambda pair: -pair[0])]
+    assert ranked_ids == expected_ids
+
+def test_score_path_arrays_without_matching_preferences():
+    context = path_preference_context({"primary_interests": ["family_law"], "learning_style": "balanced"})
+    scores = score_path_arrays(build_learning_path_score_arrays(PATHS), context)
+
+    assert scores.tolist() == pytest.approx([reference_path_relevance(path, context) for path in PATHS])
+
+def test_score_learning_paths_reuses_arrays_for_the_same_catalog():
+    context = path_preference_context(USER_PREFS)
+    scores = score_learning_paths(PATHS, context)
+
+    assert get_learning_path_score_arrays(PATHS) is get_learning_path_score_arrays(PATHS)
+    assert scores.tolist() == pytest.approx(score_path_arrays(build_learning_path_score_arrays(PATHS), context).tolist())
+
+def test_empty_catalog_scores_nothing():
+    context = path_preference_context(USER_PREFS)
+    assert score_path_arrays(build_learning_path_score_arrays([]), context).tolist() == []